@@ -1,23 +1,38 @@
 import asyncio
+import datetime as dt
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 
 from aiogram import Router, F
+from aiogram.enums import ParseMode
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
-from aiogram.types import CallbackQuery, Message
+from aiogram.types import CallbackQuery, InlineKeyboardButton, Message
+from aiogram.utils.keyboard import InlineKeyboardBuilder
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.callbacks import (
+    AdminDateCB,
+    AdminLevelCB,
+    DatesPageCB,
+    DraftCB,
+    PostActCB,
+    PostListCB,
+    PostLevelCB,
+    PostOpenCB,
+)
 from bot.config import Settings
 from bot.db import (
     create_post,
     delete_post,
-    get_post,
+    get_post_with_media,
     get_post_media,
     get_post_dates,
     get_posts_by_date,
     get_posts_by_level,
-    count_posts_by_date,
-    count_posts_by_level,
     get_broadcast_settings,
     set_teaser_content,
     update_post_level,
@@ -26,7 +41,9 @@ from bot.db import (
     update_post_text_title,
 )
 from bot.keyboards import (
-    POST_LEVELS,
+    CURSOR_TS_FORMAT,
+    FIRST_PAGE_CURSOR,
+    POST_LEVELS_SET,
     admin_menu_kb,
     admin_post_level_kb,
     confirm_delete_kb,
@@ -35,45 +52,92 @@ from bot.keyboards import (
     post_actions_kb,
     posts_list_kb,
 )
+from bot.media import build_album, split_caption
+from bot.middlewares import AdminGuard
+from bot.ratelimit import limited
 from bot.scheduler import schedule_or_send_now, unschedule_post
 from bot.time_utils import format_dt, parse_moscow_datetime
 
 admin_router = Router()
+# everything below is admin-only
+admin_router.message.outer_middleware(AdminGuard())
+admin_router.callback_query.outer_middleware(AdminGuard())
 
 PAGE_SIZE = 10
 
+# --- Admin list caches ---
+# The date list only changes when posts are created, deleted or moved to another
+# date, so page flips can be served from memory.
+DATES_CACHE_TTL = 30.0
+_dates_cache: tuple[float, list[str]] | None = None
+
+
+async def _get_post_dates_cached(db: AsyncSession, ttl: float = DATES_CACHE_TTL) -> list[str]:
+    global _dates_cache
+    cached = _dates_cache
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    dates = await get_post_dates(db)
+    _dates_cache = (time.monotonic(), dates)
+    return dates
+
+
+def _invalidate_post_caches() -> None:
+    global _dates_cache
+    _dates_cache = None
+
 # --- Media group buffering (albums) ---
 # Telegram delivers media groups as multiple updates with the same media_group_id.
 # We collect them and "finalize" after a short debounce without requiring /done_media.
-_album_tasks: dict[tuple[int, str], asyncio.Task] = {}
+# keyed by user id: a user is in one FSM state at a time, so one pending album per user
+_album_timers: dict[int, "_PendingAlbum"] = {}
+# finalize tasks started by the timers (the loop only keeps weak references to tasks)
+_album_finalizers: set[asyncio.Task] = set()
+
 
+@dataclass(slots=True)
+class _PendingAlbum:
+    deadline: float  # loop.time() after which the album counts as complete
+    finalize_coro: Callable[[], Awaitable[None]]
 
-def _album_key(message: Message, fsm_state: str) -> tuple[int, str] | None:
+
+def _album_key(message: Message) -> int | None:
     if not message.from_user:
         return None
-    return (int(message.from_user.id), fsm_state)
+    return message.from_user.id
 
 
-async def _schedule_album_finalize(
+def _schedule_album_finalize(
     *,
-    key: tuple[int, str],
+    key: int,
     state: FSMContext,
     delay_sec: float,
     finalize_coro,
 ) -> None:
-    # cancel previous task (if any)
-    prev = _album_tasks.get(key)
-    if prev and not prev.done():
-        prev.cancel()
+    # debounce: every new frame pushes the deadline back. One timer per album: a frame only
+    # updates the pending entry, and the timer re-arms itself if it fires before the deadline.
+    # Finalizers read the collected items from FSM when they run, so the latest one is enough.
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + delay_sec
+    pending = _album_timers.get(key)
+    if pending is not None:
+        pending.deadline = deadline
+        pending.finalize_coro = finalize_coro
+        return
 
-    async def _runner():
-        try:
-            await asyncio.sleep(delay_sec)
-            await finalize_coro()
-        except asyncio.CancelledError:
+    def _fire() -> None:
+        pending = _album_timers[key]
+        if loop.time() < pending.deadline:
+            loop.call_at(pending.deadline, _fire)
             return
+        # the album is complete: drop the entry so the dict only holds pending albums
+        del _album_timers[key]
+        task = asyncio.create_task(pending.finalize_coro())
+        _album_finalizers.add(task)
+        task.add_done_callback(_album_finalizers.discard)
 
-    _album_tasks[key] = asyncio.create_task(_runner())
+    _album_timers[key] = _PendingAlbum(deadline=deadline, finalize_coro=finalize_coro)
+    loop.call_at(deadline, _fire)
 
 
 def _draft_kb(*, has_text: bool, has_media: bool, has_audio: bool):
@@ -82,24 +146,48 @@ def _draft_kb(*, has_text: bool, has_media: bool, has_audio: bool):
     - Медиа / Текст / ГОТОВО | назад
     Слева ✅ если заполнено.
     """
-    from aiogram.types import InlineKeyboardButton
-    from aiogram.utils.keyboard import InlineKeyboardBuilder
-
     kb = InlineKeyboardBuilder()
     kb.row(
-        InlineKeyboardButton(text=f"{'✅ ' if has_media else ''}Медиа", callback_data="cdraft:media"),
-        InlineKeyboardButton(text=f"{'✅ ' if has_audio else ''}Аудио", callback_data="cdraft:audio"),
+        InlineKeyboardButton(text=f"{'✅ ' if has_media else ''}Медиа", callback_data=DraftCB(action="media").pack()),
+        InlineKeyboardButton(text=f"{'✅ ' if has_audio else ''}Аудио", callback_data=DraftCB(action="audio").pack()),
     )
     kb.row(
-        InlineKeyboardButton(text=f"{'✅ ' if has_text else ''}Текст", callback_data="cdraft:text"),
+        InlineKeyboardButton(text=f"{'✅ ' if has_text else ''}Текст", callback_data=DraftCB(action="text").pack()),
     )
     kb.row(
-        InlineKeyboardButton(text="✅ ГОТОВО", callback_data="cdraft:done"),
-        InlineKeyboardButton(text="⬅️ Назад", callback_data="cdraft:back"),
+        InlineKeyboardButton(text="✅ ГОТОВО", callback_data=DraftCB(action="done").pack()),
+        InlineKeyboardButton(text="⬅️ Назад", callback_data=DraftCB(action="back").pack()),
     )
     return kb.as_markup()
 
 
+_DRAFT_TEMPLATE = (
+    "📝 <b>Черновик поста</b>\n\n"
+    "🗂 <b>{title}</b>\n"
+    "🎚 <b>{level}</b>\n"
+    "📎 <b>Медиа</b>: {media_label}\n"
+    "🔊 <b>Аудио</b>: {audio_label}\n"
+    "✏️ <b>Текст</b>: {text_flag}\n\n"
+    "{preview}"
+)
+
+
+# card of a saved post: admin post view and the confirmations after edits
+_POST_CARD_TEMPLATE = "<b>Пост #{id}</b>{status}\n⏰ {when}\n🎚 {level}\n{media}📝 <b>{title}</b>\n\n{text}"
+
+
+def _render_post_card(post, tz: str, *, media: str | None = None, status: str | None = None) -> str:
+    return _POST_CARD_TEMPLATE.format(
+        id=post.id,
+        status=f" ({status})" if status else "",
+        when=format_dt(post.send_at, tz),
+        level=post.level,
+        media=f"📎 {media}\n" if media else "",
+        title=post.title or "(без названия)",
+        text=post.text,
+    )
+
+
 async def _render_create_draft(message: Message, state: FSMContext, settings: "Settings") -> None:
     """
     Рисует/перерисовывает черновик (одно сообщение) + кнопки.
@@ -131,22 +219,28 @@ async def _render_create_draft(message: Message, state: FSMContext, settings: "S
     if not preview:
         preview = "(текста нет)"
 
-    body = (
-        "📝 <b>Черновик поста</b>\n\n"
-        f"🗂 <b>{title}</b>\n"
-        f"🎚 <b>{level}</b>\n"
-        f"📎 <b>Медиа</b>: {media_label}\n"
-        f"🔊 <b>Аудио</b>: {audio_label}\n"
-        f"✏️ <b>Текст</b>: {'есть' if has_text else 'нет'}\n\n"
-        f"{preview}"
+    body = _DRAFT_TEMPLATE.format_map(
+        {
+            "title": title,
+            "level": level,
+            "media_label": media_label,
+            "audio_label": audio_label,
+            "text_flag": "есть" if has_text else "нет",
+            "preview": preview,
+        }
     )
 
     # remember draft message to edit in-place
     draft_chat_id = data.get("draft_chat_id")
     draft_message_id = data.get("draft_message_id")
+    # the keyboard follows from the same flags as the body, so the body alone tells if anything changed
+    body_hash = hash(body)
     kb = _draft_kb(has_text=has_text, has_media=has_media, has_audio=has_audio)
 
     if draft_chat_id and draft_message_id:
+        if data.get("draft_body_hash") == body_hash:
+            # nothing to redraw (Telegram would answer "message is not modified")
+            return
         try:
             await message.bot.edit_message_text(
                 chat_id=draft_chat_id,
@@ -155,76 +249,83 @@ async def _render_create_draft(message: Message, state: FSMContext, settings: "S
                 reply_markup=kb,
                 disable_web_page_preview=True,
             )
+            await state.update_data(draft_body_hash=body_hash)
             return
         except Exception:
             # fall back to sending a new draft message
             pass
 
     sent = await message.answer(body, reply_markup=kb, disable_web_page_preview=True)
-    await state.update_data(draft_chat_id=sent.chat.id, draft_message_id=sent.message_id)
+    await state.update_data(draft_chat_id=sent.chat.id, draft_message_id=sent.message_id, draft_body_hash=body_hash)
+
+
+# (media_type, file_id getter) in priority order; the first present attribute wins
+_MEDIA_SPECS = (
+    ("photo", lambda m: m.photo[-1].file_id),
+    ("video", lambda m: m.video.file_id),
+    ("voice", lambda m: m.voice.file_id),
+    ("video_note", lambda m: m.video_note.file_id),
+    ("audio", lambda m: m.audio.file_id),
+    ("document", lambda m: m.document.file_id),
+)
 
 
 def _extract_message_content(message: Message) -> tuple[str, str | None, str | None]:
     """
     Extract text/caption (as HTML) + media type + Telegram file_id from a message.
     """
-    html_text = getattr(message, "html_text", None)
-    html_caption = getattr(message, "html_caption", None) or getattr(message, "caption_html", None)
-    text = html_text or html_caption or message.text or message.caption or ""
-
-    if message.photo:
-        return text, "photo", message.photo[-1].file_id
-    if message.video:
-        return text, "video", message.video.file_id
-    if message.voice:
-        return text, "voice", message.voice.file_id
-    if message.video_note:
-        return text, "video_note", message.video_note.file_id
-    if message.audio:
-        return text, "audio", message.audio.file_id
-    if message.document:
-        return text, "document", message.document.file_id
+    # html_text covers both text and caption in aiogram 3
+    text = message.html_text
+
+    for media_type, get_file_id in _MEDIA_SPECS:
+        if getattr(message, media_type):
+            return text, media_type, get_file_id(message)
 
     return text, None, None
 
 
+# media_type -> coroutine sending that media with a caption into the message's chat
+_PREVIEW_SENDERS = {
+    "photo": lambda m, fid, cap: m.answer_photo(photo=fid, caption=cap),
+    "video": lambda m, fid, cap: m.answer_video(video=fid, caption=cap),
+    "document": lambda m, fid, cap: m.answer_document(document=fid, caption=cap),
+    "audio": lambda m, fid, cap: m.answer_audio(audio=fid, caption=cap),
+    "voice": lambda m, fid, cap: m.answer_voice(voice=fid, caption=cap),
+    # video notes can't carry a caption
+    "video_note": lambda m, fid, cap: m.answer_video_note(video_note=fid),
+}
+
+
 async def _send_post_preview(message: Message, post) -> None:
     """
     Sends a preview of the post content into the current chat.
     This is needed because "view post" is rendered as text, but post may contain media.
     """
-    media_type = (getattr(post, "media_type", None) or "").strip().lower()
-    file_id = getattr(post, "file_id", None)
-    text = getattr(post, "text", "") or ""
+    media_type = (post.media_type or "").strip().lower()
+    file_id = post.file_id
+    text = post.text or ""
 
     # Telegram caption limit is 1024 chars. If longer, send as separate message.
     caption = text if len(text) <= 1024 else ""
     tail_text = "" if caption else text
 
-    if not media_type or not file_id:
-        return
-
-    if media_type == "photo":
-        await message.answer_photo(photo=file_id, caption=caption)
-    elif media_type == "video":
-        await message.answer_video(video=file_id, caption=caption)
-    elif media_type == "document":
-        await message.answer_document(document=file_id, caption=caption)
-    elif media_type == "audio":
-        await message.answer_audio(audio=file_id, caption=caption)
-    elif media_type == "voice":
-        await message.answer_voice(voice=file_id, caption=caption)
-    elif media_type == "video_note":
-        await message.answer_video_note(video_note=file_id)
-    else:
-        # unknown media type: ignore
+    sender = _PREVIEW_SENDERS.get(media_type)
+    if sender is None or not file_id:
+        # no media or unknown media type: nothing to preview
         return
 
+    # in order: the tail text continues the media's caption
+    await limited(sender(message, file_id, caption), message.chat.id)
     if tail_text.strip():
-        await message.answer(tail_text)
+        await limited(message.answer(tail_text), message.chat.id)
+
 
-def _is_admin(user_id: int | None, settings: Settings) -> bool:
-    return bool(user_id) and user_id in settings.admin_ids
+async def _reset_state(state: FSMContext, new_state: State, **data) -> None:
+    """
+    clear() + update_data() + set_state() in two storage writes: set_data() replaces the data wholesale.
+    """
+    await state.set_state(new_state)
+    await state.set_data(data)
 
 
 class CreatePostFSM(StatesGroup):
@@ -251,34 +352,20 @@ class TeaserFSM(StatesGroup):
 
 
 @admin_router.message(Command("admin"))
-async def cmd_admin(message: Message, settings: Settings):
-    if not _is_admin(message.from_user.id if message.from_user else None, settings):
-        await message.answer("Доступ запрещён.")
-        return
+async def cmd_admin(message: Message):
     await message.answer("Админ-панель:", reply_markup=admin_menu_kb())
 
 
 @admin_router.callback_query(F.data == "admin:back")
-async def admin_back(call: CallbackQuery, settings: Settings):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
-        return
+async def admin_back(call: CallbackQuery):
     await call.message.edit_text("Админ-панель:", reply_markup=admin_menu_kb())
     await call.answer()
 
 
 @admin_router.callback_query(F.data == "admin:teaser")
-async def admin_teaser(call: CallbackQuery, settings: Settings, state: FSMContext, session_factory):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
-        return
-    db = session_factory()
-    try:
-        s = get_broadcast_settings(db)
-    finally:
-        db.close()
-    await state.clear()
-    await state.set_state(TeaserFSM.content)
+async def admin_teaser(call: CallbackQuery, state: FSMContext, db_read: AsyncSession):
+    s = await get_broadcast_settings(db_read)
+    await _reset_state(state, TeaserFSM.content)
     current = "не задан" if not (s.teaser_text.strip() or s.teaser_file_id) else "задан"
     await call.message.edit_text(
         "🎁 <b>Сюрприз (прелюдия)</b>\n\n"
@@ -290,34 +377,21 @@ async def admin_teaser(call: CallbackQuery, settings: Settings, state: FSMContex
 
 
 @admin_router.message(TeaserFSM.content)
-async def admin_teaser_save(message: Message, state: FSMContext, settings: Settings, session_factory):
-    if not _is_admin(message.from_user.id if message.from_user else None, settings):
-        return
+async def admin_teaser_save(message: Message, state: FSMContext, db: AsyncSession):
     text, media_type, file_id = _extract_message_content(message)
     if not text.strip() and not file_id:
         await message.answer("Сообщение пустое. Пришлите текст или медиа ещё раз:")
         return
-    db = session_factory()
-    try:
-        set_teaser_content(db, text=text, media_type=media_type, file_id=file_id)
-    finally:
-        db.close()
+    await set_teaser_content(db, text=text, media_type=media_type, file_id=file_id)
     await state.clear()
     await message.answer("✅ Сюрприз обновлён.", reply_markup=admin_menu_kb())
 
 @admin_router.callback_query(F.data == "admin:dates")
-async def admin_dates(call: CallbackQuery, settings: Settings, session_factory):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
-        return
-    db = session_factory()
-    try:
-        all_dates = get_post_dates(db)
-    finally:
-        db.close()
+async def admin_dates(call: CallbackQuery, db_read: AsyncSession):
+    all_dates = await _get_post_dates_cached(db_read)
 
     page = 0
-    chunk = all_dates[page * PAGE_SIZE : (page + 1) * PAGE_SIZE]
+    chunk = tuple(all_dates[page * PAGE_SIZE : (page + 1) * PAGE_SIZE])
     await call.message.edit_text(
         "🗓 <b>Посты по датам</b>\n\nВыберите дату:",
         reply_markup=dates_kb(chunk, page=page, has_prev=False, has_next=len(all_dates) > (page + 1) * PAGE_SIZE),
@@ -325,22 +399,13 @@ async def admin_dates(call: CallbackQuery, settings: Settings, session_factory):
     await call.answer()
 
 
-@admin_router.callback_query(F.data.startswith("dpage:"))
-async def admin_dates_page(call: CallbackQuery, settings: Settings, session_factory):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
-        return
-    page = int(call.data.split(":", 1)[1])
-    if page < 0:
-        page = 0
-    db = session_factory()
-    try:
-        all_dates = get_post_dates(db)
-    finally:
-        db.close()
+@admin_router.callback_query(DatesPageCB.filter())
+async def admin_dates_page(call: CallbackQuery, callback_data: DatesPageCB, db_read: AsyncSession):
+    page = max(callback_data.page, 0)
+    all_dates = await _get_post_dates_cached(db_read)
     max_page = max(0, (len(all_dates) - 1) // PAGE_SIZE) if all_dates else 0
     page = min(page, max_page)
-    chunk = all_dates[page * PAGE_SIZE : (page + 1) * PAGE_SIZE]
+    chunk = tuple(all_dates[page * PAGE_SIZE : (page + 1) * PAGE_SIZE])
     await call.message.edit_text(
         "🗓 <b>Посты по датам</b>\n\nВыберите дату:",
         reply_markup=dates_kb(chunk, page=page, has_prev=page > 0, has_next=page < max_page),
@@ -349,32 +414,25 @@ async def admin_dates_page(call: CallbackQuery, settings: Settings, session_fact
 
 
 @admin_router.callback_query(F.data == "admin:levels")
-async def admin_levels(call: CallbackQuery, settings: Settings):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
-        return
+async def admin_levels(call: CallbackQuery):
     await call.message.edit_text("🎚 <b>Посты по уровням</b>\n\nВыберите уровень:", reply_markup=levels_kb())
     await call.answer()
 
 
-@admin_router.callback_query(F.data.startswith("adate:"))
-async def open_date_posts(call: CallbackQuery, settings: Settings, session_factory):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
-        return
-    date_str = call.data.split(":", 1)[1]
+@admin_router.callback_query(AdminDateCB.filter())
+async def open_date_posts(call: CallbackQuery, callback_data: AdminDateCB, settings: Settings, db_read: AsyncSession):
     # render page 0 for this date
-    await _render_posts_list(call, settings, session_factory=session_factory, ctx="d", ctx_value=date_str, page=0)
+    await _render_posts_list(
+        call, settings, db=db_read, ctx="d", ctx_value=callback_data.date, page=0, cursor=FIRST_PAGE_CURSOR
+    )
     await call.answer()
 
 
-@admin_router.callback_query(F.data.startswith("alevel:"))
-async def open_level_posts(call: CallbackQuery, settings: Settings, session_factory):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
-        return
-    level = call.data.split(":", 1)[1]
-    await _render_posts_list(call, settings, session_factory=session_factory, ctx="l", ctx_value=level, page=0)
+@admin_router.callback_query(AdminLevelCB.filter())
+async def open_level_posts(call: CallbackQuery, callback_data: AdminLevelCB, settings: Settings, db_read: AsyncSession):
+    await _render_posts_list(
+        call, settings, db=db_read, ctx="l", ctx_value=callback_data.level, page=0, cursor=FIRST_PAGE_CURSOR
+    )
     await call.answer()
 
 
@@ -383,18 +441,35 @@ async def noop(call: CallbackQuery):
     await call.answer()
 
 
-@admin_router.callback_query(F.data.startswith("plist:"))
-async def posts_page(call: CallbackQuery, settings: Settings, session_factory):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
-        return
+@admin_router.callback_query(PostListCB.filter())
+async def posts_page(call: CallbackQuery, callback_data: PostListCB, settings: Settings, db_read: AsyncSession):
 
-    _, ctx, ctx_value, page_raw = call.data.split(":", 3)
-    page = int(page_raw)
-    await _render_posts_list(call, settings, session_factory=session_factory, ctx=ctx, ctx_value=ctx_value, page=page)
+    await _render_posts_list(
+        call,
+        settings,
+        db=db_read,
+        ctx=callback_data.ctx,
+        ctx_value=callback_data.ctx_value,
+        page=callback_data.page,
+        cursor=callback_data.cursor,
+    )
     await call.answer()
 
 
+def _parse_cursor(cursor: str) -> tuple[str, tuple[dt.datetime, int] | None]:
+    """
+    "a<ts>_<id>" / "b<ts>_<id>" -> (direction, (send_at, id)); anything else means the first page.
+    """
+    direction, raw = cursor[:1], cursor[1:]
+    if direction not in ("a", "b"):
+        return "a", None
+    try:
+        ts_raw, id_raw = raw.split("_", 1)
+        return direction, (dt.datetime.strptime(ts_raw, CURSOR_TS_FORMAT), int(id_raw))
+    except ValueError:
+        return "a", None
+
+
 async def _render_posts_list(
     call: CallbackQuery,
     settings: Settings,
@@ -402,43 +477,52 @@ async def _render_posts_list(
     ctx: str,
     ctx_value: str,
     page: int,
-    session_factory,
+    cursor: str,
+    db: AsyncSession,
 ) -> None:
     """
     ctx:
       - "d": date (YYYY-MM-DD)
       - "l": level (all/starters/explorers/achievers)
+    cursor: keyset position of the page (see bot.keyboards.FIRST_PAGE_CURSOR)
     """
-    if page < 0:
-        page = 0
+    direction, key = _parse_cursor(cursor)
+    if key is None:
+        page, cursor = 0, FIRST_PAGE_CURSOR
+    seek = {"before": key} if direction == "b" else {"after": key}
+
+    # fetch one extra row to know whether there is a page beyond this one
+    if ctx == "d":
+        rows = await get_posts_by_date(db, ctx_value, limit=PAGE_SIZE + 1, **seek)
+        back_cb = "admin:dates"
+        title = f"🗓 <b>Посты за {ctx_value}</b>"
+    else:
+        rows = await get_posts_by_level(db, ctx_value, limit=PAGE_SIZE + 1, **seek)
+        back_cb = "admin:levels"
+        title = f"🎚 <b>Посты уровня {ctx_value}</b>"
+
+    if not rows and key is not None:
+        # the page emptied under us (posts deleted/moved): start over
+        await _render_posts_list(
+            call, settings, db=db, ctx=ctx, ctx_value=ctx_value, page=0, cursor=FIRST_PAGE_CURSOR
+        )
+        return
 
-    db = session_factory()
-    try:
-        if ctx == "d":
-            total = count_posts_by_date(db, ctx_value)
-            max_page = max(0, (total - 1) // PAGE_SIZE) if total else 0
-            page = min(page, max_page)
-            offset = page * PAGE_SIZE
-            posts = get_posts_by_date(db, ctx_value, limit=PAGE_SIZE, offset=offset)
-            back_cb = "admin:dates"
-            title = f"🗓 <b>Посты за {ctx_value}</b>"
-        else:
-            total = count_posts_by_level(db, ctx_value)
-            max_page = max(0, (total - 1) // PAGE_SIZE) if total else 0
-            page = min(page, max_page)
-            offset = page * PAGE_SIZE
-            posts = get_posts_by_level(db, ctx_value, limit=PAGE_SIZE, offset=offset)
-            back_cb = "admin:levels"
-            title = f"🎚 <b>Посты уровня {ctx_value}</b>"
-    finally:
-        db.close()
-
-    if not posts:
+    if not rows:
         await call.message.edit_text("Постов не найдено.", reply_markup=admin_menu_kb())
         return
 
-    has_prev = page > 0
-    has_next = page < max_page
+    if direction == "b":
+        has_prev = len(rows) > PAGE_SIZE
+        has_next = True
+        posts = rows[-PAGE_SIZE:]
+        if not has_prev:
+            page, cursor = 0, FIRST_PAGE_CURSOR
+    else:
+        has_prev = page > 0
+        has_next = len(rows) > PAGE_SIZE
+        posts = rows[:PAGE_SIZE]
+
     await call.message.edit_text(
         title,
         reply_markup=posts_list_kb(
@@ -448,6 +532,7 @@ async def _render_posts_list(
             ctx=ctx,
             ctx_value=ctx_value,
             page=page,
+            cursor=cursor,
             has_prev=has_prev,
             has_next=has_next,
         ),
@@ -455,20 +540,14 @@ async def _render_posts_list(
 
 
 @admin_router.callback_query(F.data == "admin:create")
-async def admin_create(call: CallbackQuery, settings: Settings, state: FSMContext):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
-        return
-    await state.clear()
-    await state.set_state(CreatePostFSM.title)
+async def admin_create(call: CallbackQuery, state: FSMContext):
+    await _reset_state(state, CreatePostFSM.title)
     await call.message.edit_text("Введите <b>название</b> поста (для списка кнопок):")
     await call.answer()
 
 
 @admin_router.message(CreatePostFSM.title)
-async def create_title(message: Message, state: FSMContext, settings: Settings):
-    if not _is_admin(message.from_user.id if message.from_user else None, settings):
-        return
+async def create_title(message: Message, state: FSMContext):
     title = (message.text or "").strip()
     if not title:
         await message.answer("Название не должно быть пустым. Введите название ещё раз:")
@@ -478,18 +557,15 @@ async def create_title(message: Message, state: FSMContext, settings: Settings):
     await message.answer("Выберите <b>уровень</b> для поста:", reply_markup=admin_post_level_kb())
 
 
-@admin_router.callback_query(F.data.startswith("plevel:"), CreatePostFSM.level)
-async def create_pick_level(call: CallbackQuery, settings: Settings, state: FSMContext):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
-        return
-    level = call.data.split(":", 1)[1]
-    if level != "all" and level not in POST_LEVELS:
+@admin_router.callback_query(PostLevelCB.filter(), CreatePostFSM.level)
+async def create_pick_level(call: CallbackQuery, callback_data: PostLevelCB, settings: Settings, state: FSMContext):
+    level = callback_data.level
+    if level not in POST_LEVELS_SET:
         await call.answer("Неизвестный уровень", show_alert=True)
         return
-    await state.update_data(level=level)
     # init empty draft
     await state.update_data(
+        level=level,
         draft_text="",
         draft_media_items=[],
         draft_audio_items=[],
@@ -497,6 +573,7 @@ async def create_pick_level(call: CallbackQuery, settings: Settings, state: FSMC
         album_items=None,
         draft_chat_id=None,
         draft_message_id=None,
+        draft_body_hash=None,
     )
     await state.set_state(CreatePostFSM.draft)
     # show draft (as separate message) to keep UI stable
@@ -509,12 +586,9 @@ async def create_pick_level(call: CallbackQuery, settings: Settings, state: FSMC
     await call.answer()
 
 
-@admin_router.callback_query(F.data.startswith("cdraft:"), CreatePostFSM.draft)
-async def create_draft_actions(call: CallbackQuery, settings: Settings, state: FSMContext):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
-        return
-    action = call.data.split(":", 1)[1]
+@admin_router.callback_query(DraftCB.filter(), CreatePostFSM.draft)
+async def create_draft_actions(call: CallbackQuery, callback_data: DraftCB, settings: Settings, state: FSMContext):
+    action = callback_data.action
 
     if action == "back":
         await state.clear()
@@ -562,9 +636,7 @@ async def create_draft_actions(call: CallbackQuery, settings: Settings, state: F
 
 @admin_router.message(CreatePostFSM.edit_text)
 async def create_set_text(message: Message, state: FSMContext, settings: Settings):
-    if not _is_admin(message.from_user.id if message.from_user else None, settings):
-        return
-    txt = (getattr(message, "html_text", None) or getattr(message, "html_caption", None) or message.text or message.caption or "").strip()
+    txt = message.html_text.strip()
     if not txt:
         await message.answer("Текст пустой. Пришлите ещё раз:")
         return
@@ -575,14 +647,13 @@ async def create_set_text(message: Message, state: FSMContext, settings: Setting
 
 @admin_router.message(CreatePostFSM.edit_media)
 async def create_set_media(message: Message, state: FSMContext, settings: Settings):
-    if not _is_admin(message.from_user.id if message.from_user else None, settings):
-        return
 
     # album (photos/videos only)
     if message.media_group_id and (message.photo or message.video):
         data = await state.get_data()
         album_id = data.get("album_id")
-        album_items = list(data.get("album_items") or [])
+        # no defensive copy: the list is written back with update_data() right below
+        album_items = data.get("album_items") or []
         if album_id and album_id != message.media_group_id:
             # allow only one album at a time
             await message.answer("Вы отправляете новый альбом. Подождите пару секунд, пока сохранится предыдущий.")
@@ -597,7 +668,7 @@ async def create_set_media(message: Message, state: FSMContext, settings: Settin
 
         await state.update_data(album_id=album_id, album_items=album_items)
 
-        key = _album_key(message, "CreatePostFSM.edit_media")
+        key = _album_key(message)
         if key:
             async def _finalize():
                 d = await state.get_data()
@@ -614,7 +685,7 @@ async def create_set_media(message: Message, state: FSMContext, settings: Settin
                 await state.set_state(CreatePostFSM.draft)
                 await _render_create_draft(message, state, settings)
 
-            await _schedule_album_finalize(key=key, state=state, delay_sec=1.2, finalize_coro=_finalize)
+            _schedule_album_finalize(key=key, state=state, delay_sec=1.2, finalize_coro=_finalize)
         return
 
     # single media (any supported type)
@@ -633,30 +704,26 @@ async def create_set_media(message: Message, state: FSMContext, settings: Settin
 
 @admin_router.message(CreatePostFSM.edit_audio)
 async def create_set_audio(message: Message, state: FSMContext, settings: Settings):
-    if not _is_admin(message.from_user.id if message.from_user else None, settings):
-        return
     if not message.audio:
         await message.answer("Пришлите именно аудиофайл(ы) (Music/Audio).")
         return
 
     data = await state.get_data()
-    audio_items = list(data.get("draft_audio_items") or [])
+    audio_items = data.get("draft_audio_items") or []
     audio_items.append(message.audio.file_id)
     await state.update_data(draft_audio_items=audio_items)
 
-    key = _album_key(message, "CreatePostFSM.edit_audio")
+    key = _album_key(message)
     if key:
         async def _finalize():
             await state.set_state(CreatePostFSM.draft)
             await _render_create_draft(message, state, settings)
 
-        await _schedule_album_finalize(key=key, state=state, delay_sec=1.2, finalize_coro=_finalize)
+        _schedule_album_finalize(key=key, state=state, delay_sec=1.2, finalize_coro=_finalize)
 
 
 @admin_router.message(CreatePostFSM.send_at)
-async def create_send_at(message: Message, state: FSMContext, settings: Settings, session_factory, scheduler: AsyncIOScheduler):
-    if not _is_admin(message.from_user.id if message.from_user else None, settings):
-        return
+async def create_send_at(message: Message, state: FSMContext, settings: Settings, db: AsyncSession, session_factory, scheduler: AsyncIOScheduler):
     try:
         send_at = parse_moscow_datetime(message.text or "", settings.tz)
     except Exception:
@@ -679,14 +746,8 @@ async def create_send_at(message: Message, state: FSMContext, settings: Settings
     attachments.extend(media_items)
     attachments.extend([("audio", fid) for fid in audio_items])
 
-    db = session_factory()
-    try:
-        post = create_post(db, title=title, text=text, send_at=send_at, level=level)
-        post = update_post_content(db, post.id, text=text, media_type=None, file_id=None, media_group=attachments) or post
-    finally:
-        db.close()
-
-    schedule_or_send_now(bot=message.bot, scheduler=scheduler, session_factory=session_factory, post=post, tz=settings.tz)
+    post = await create_post(db, title=title, text=text, send_at=send_at, level=level, media_group=attachments)
+    _invalidate_post_caches()
 
     await state.clear()
     await message.answer(
@@ -695,30 +756,67 @@ async def create_send_at(message: Message, state: FSMContext, settings: Settings
         f"⏰ {format_dt(post.send_at, settings.tz)}",
         reply_markup=post_actions_kb(post.id, back_cb="admin:back"),
     )
+    # a post that is already due goes out in a background task, after the admin got the reply
+    schedule_or_send_now(bot=message.bot, scheduler=scheduler, session_factory=session_factory, post=post, tz=settings.tz)
 
 
-@admin_router.callback_query(F.data.startswith("post:"))
-async def open_post(call: CallbackQuery, settings: Settings, session_factory):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
+async def _send_media_items_preview(message: Message, post, media_items) -> None:
+    """
+    Preview for posts stored as PostMedia items (albums / attachments).
+    """
+    caption, tail_text = split_caption(post.text or "")
+    chat_id = message.chat.id
+
+    # photo/video-only -> album
+    album = build_album(media_items, caption)
+    if album:
+        # in order: the tail text continues the album's caption
+        await limited(message.bot.send_media_group(chat_id=chat_id, media=album), chat_id)
+        if tail_text.strip():
+            await limited(message.answer(tail_text, parse_mode=ParseMode.HTML), chat_id)
         return
-    parts = call.data.split(":")
-    post_id = int(parts[1])
+
+    # otherwise (audio etc) -> send sequentially; caption only on first
+    cap = caption or None
+    for item in media_items:
+        itype = (item.media_type or "").strip().lower()
+        sender = _PREVIEW_SENDERS.get(itype)
+        if sender is None:
+            # unknown media type: ignore
+            continue
+        await limited(sender(message, item.file_id, cap), chat_id)
+        if cap and itype == "video_note":
+            # video notes can't carry a caption: send it right after
+            await limited(message.answer(cap, parse_mode=ParseMode.HTML), chat_id)
+        cap = None
+
+    if tail_text.strip():
+        await limited(message.answer(tail_text, parse_mode=ParseMode.HTML), chat_id)
+
+
+@admin_router.callback_query(PostOpenCB.filter())
+async def open_post(call: CallbackQuery, callback_data: PostOpenCB, settings: Settings, db_read: AsyncSession):
     back_cb = "admin:back"
-    if len(parts) == 5:
-        _, _, ctx, ctx_value, page = parts
-        back_cb = f"plist:{ctx}:{ctx_value}:{page}"
-    db = session_factory()
-    try:
-        post = get_post(db, post_id)
-        media_items = get_post_media(db, post_id)
-    finally:
-        db.close()
+    if callback_data.ctx and callback_data.ctx_value and callback_data.page is not None and callback_data.cursor:
+        back_cb = PostListCB(
+            ctx=callback_data.ctx,
+            ctx_value=callback_data.ctx_value,
+            page=callback_data.page,
+            cursor=callback_data.cursor,
+        ).pack()
+    await _show_post(call, settings, db_read, callback_data.id, back_cb=back_cb)
+
+
+async def _show_post(call: CallbackQuery, settings: Settings, db: AsyncSession, post_id: int, *, back_cb: str) -> None:
+    post = await get_post_with_media(db, post_id)
     if not post:
         await call.answer("Пост не найден", show_alert=True)
         return
+    media_items = post.media_items
 
     status = "✅ отправлен" if post.sent else "🕒 ожидает"
+    if post.sent and post.total is not None:
+        status += f", {post.delivered}/{post.total}"
     if media_items:
         counts: dict[str, int] = {}
         for it in media_items:
@@ -727,99 +825,39 @@ async def open_post(call: CallbackQuery, settings: Settings, session_factory):
         media = ", ".join([f"{k}×{v}" for k, v in sorted(counts.items())])
     else:
         media = post.media_type or "text"
-    await call.message.edit_text(
-        f"<b>Пост #{post.id}</b> ({status})\n"
-        f"⏰ {format_dt(post.send_at, settings.tz)}\n"
-        f"🎚 {post.level}\n"
-        f"📎 {media}\n"
-        f"📝 <b>{post.title or '(без названия)'}</b>\n\n"
-        f"{post.text}",
+    header = call.message.edit_text(
+        _render_post_card(post, settings.tz, media=media, status=status),
         reply_markup=post_actions_kb(post.id, back_cb=back_cb),
     )
-    # Send media preview as separate message(s)
-    try:
-        if media_items:
-            from aiogram.enums import ParseMode
-            from aiogram.types import InputMediaPhoto, InputMediaVideo
-
-            text = post.text or ""
-            caption = text if len(text) <= 1024 else ""
-            tail_text = "" if caption else text
-
-            types = [(it.media_type or "").strip().lower() for it in media_items]
-
-            # photo/video-only -> album
-            if types and all(t in ("photo", "video") for t in types):
-                album = []
-                for idx, item in enumerate(media_items):
-                    itype = (item.media_type or "").strip().lower()
-                    if itype == "photo":
-                        album.append(
-                            InputMediaPhoto(
-                                media=item.file_id,
-                                caption=caption if idx == 0 else None,
-                                parse_mode=ParseMode.HTML if idx == 0 and caption else None,
-                            )
-                        )
-                    elif itype == "video":
-                        album.append(
-                            InputMediaVideo(
-                                media=item.file_id,
-                                caption=caption if idx == 0 else None,
-                                parse_mode=ParseMode.HTML if idx == 0 and caption else None,
-                            )
-                        )
-                if album:
-                    await call.message.bot.send_media_group(chat_id=call.message.chat.id, media=album)
-                    if tail_text.strip():
-                        await call.message.answer(tail_text, parse_mode=ParseMode.HTML)
-                    await call.answer()
-                    return
 
-            # otherwise (audio etc) -> send sequentially; caption only on first
-            first_caption_sent = False
-            for item in media_items:
-                itype = (item.media_type or "").strip().lower()
-                fid = item.file_id
-                cap = None
-                pm = None
-                if not first_caption_sent and caption:
-                    cap = caption
-                    pm = ParseMode.HTML
-                    first_caption_sent = True
-
-                if itype == "audio":
-                    await call.message.bot.send_audio(chat_id=call.message.chat.id, audio=fid, caption=cap, parse_mode=pm)
-                elif itype == "document":
-                    await call.message.bot.send_document(chat_id=call.message.chat.id, document=fid, caption=cap, parse_mode=pm)
-                elif itype == "voice":
-                    await call.message.bot.send_voice(chat_id=call.message.chat.id, voice=fid, caption=cap, parse_mode=pm)
-                elif itype == "video_note":
-                    await call.message.bot.send_video_note(chat_id=call.message.chat.id, video_note=fid)
-                    if cap:
-                        await call.message.answer(cap, parse_mode=ParseMode.HTML)
-                elif itype == "photo":
-                    await call.message.bot.send_photo(chat_id=call.message.chat.id, photo=fid, caption=cap, parse_mode=pm)
-                elif itype == "video":
-                    await call.message.bot.send_video(chat_id=call.message.chat.id, video=fid, caption=cap, parse_mode=pm)
-
-            if tail_text.strip():
-                await call.message.answer(tail_text, parse_mode=ParseMode.HTML)
-        else:
-            await _send_post_preview(call.message, post)
-    except Exception:
-        pass
+    async def _preview() -> None:
+        # Send media preview as separate message(s)
+        try:
+            if media_items:
+                await _send_media_items_preview(call.message, post, media_items)
+            else:
+                await _send_post_preview(call.message, post)
+        except Exception:
+            pass
+
+    # the header edit and the preview are independent: don't let a slow upload hold the header
+    await asyncio.gather(limited(header), _preview())
     await call.answer()
 
 
-@admin_router.callback_query(F.data.startswith("pact:"))
-async def post_action(call: CallbackQuery, settings: Settings, state: FSMContext, session_factory, scheduler: AsyncIOScheduler):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
-        return
+@admin_router.callback_query(PostActCB.filter())
+async def post_action(
+    call: CallbackQuery,
+    callback_data: PostActCB,
+    settings: Settings,
+    state: FSMContext,
+    db: AsyncSession,
+    db_read: AsyncSession,
+    scheduler: AsyncIOScheduler,
+):
 
-    _, action, post_id_raw = call.data.split(":", 2)
-    post_id = int(post_id_raw)
+    action = callback_data.action
+    post_id = callback_data.post_id
 
     if action == "del":
         await call.message.edit_text("Точно удалить пост?", reply_markup=confirm_delete_kb(post_id))
@@ -828,40 +866,34 @@ async def post_action(call: CallbackQuery, settings: Settings, state: FSMContext
 
     if action == "del_yes":
         unschedule_post(scheduler, post_id)
-        db = session_factory()
-        try:
-            ok = delete_post(db, post_id)
-        finally:
-            db.close()
-            await call.message.edit_text("✅ Удалено." if ok else "Пост уже удалён.", reply_markup=admin_menu_kb())
-            await call.answer()
-            return
+        ok = await delete_post(db, post_id)
+        _invalidate_post_caches()
+        await call.message.edit_text("✅ Удалено." if ok else "Пост уже удалён.", reply_markup=admin_menu_kb())
+        await call.answer()
+        return
 
     if action == "del_no":
         # show post again
-        await open_post(call, settings, session_factory)
+        await _show_post(call, settings, db_read, post_id, back_cb="admin:back")
         return
 
-    await state.clear()
-    await state.update_data(post_id=post_id)
-
     if action == "title":
-        await state.set_state(EditPostFSM.title)
+        await _reset_state(state, EditPostFSM.title, post_id=post_id)
         await call.message.edit_text("Введите новое <b>название</b> поста:")
     elif action == "level":
-        await state.set_state(EditPostFSM.level)
+        await _reset_state(state, EditPostFSM.level, post_id=post_id)
         await call.message.edit_text("Выберите новый <b>уровень</b> для поста:", reply_markup=admin_post_level_kb())
     elif action == "content":
-        await state.set_state(EditPostFSM.content)
+        await _reset_state(state, EditPostFSM.content, post_id=post_id)
         await call.message.edit_text("Пришлите новое <b>сообщение поста</b> (текст / фото / видео / кружочек / аудио / голос):")
     elif action == "text":
-        await state.set_state(EditPostFSM.text)
+        await _reset_state(state, EditPostFSM.text, post_id=post_id)
         await call.message.edit_text("Введите новый <b>текст/подпись</b> поста (для медиа это будет caption):")
     elif action == "audio":
-        await state.set_state(EditPostFSM.audio)
+        await _reset_state(state, EditPostFSM.audio, post_id=post_id)
         await call.message.edit_text("Пришлите <b>аудио</b> (можно несколько подряд). Я обновлю аудио одним блоком.")
     elif action == "time":
-        await state.set_state(EditPostFSM.send_at)
+        await _reset_state(state, EditPostFSM.send_at, post_id=post_id)
         await call.message.edit_text(
             "Введите новое <b>время отправки</b>:\n"
             "<code>YYYY-MM-DD HH:MM</code>\n\n"
@@ -874,23 +906,19 @@ async def post_action(call: CallbackQuery, settings: Settings, state: FSMContext
     await call.answer()
 
 
-@admin_router.callback_query(F.data.startswith("plevel:"), EditPostFSM.level)
-async def edit_pick_level(call: CallbackQuery, settings: Settings, state: FSMContext, session_factory):
-    if not _is_admin(call.from_user.id, settings):
-        await call.answer("Нет доступа", show_alert=True)
-        return
-    level = call.data.split(":", 1)[1]
-    if level != "all" and level not in POST_LEVELS:
+@admin_router.callback_query(PostLevelCB.filter(), EditPostFSM.level)
+async def edit_pick_level(
+    call: CallbackQuery, callback_data: PostLevelCB, settings: Settings, state: FSMContext, db: AsyncSession
+):
+    level = callback_data.level
+    if level not in POST_LEVELS_SET:
         await call.answer("Неизвестный уровень", show_alert=True)
         return
 
     data = await state.get_data()
     post_id = int(data["post_id"])
-    db = session_factory()
-    try:
-        post = update_post_level(db, post_id, level=level)
-    finally:
-        db.close()
+    post = await update_post_level(db, post_id, level=level)
+    _invalidate_post_caches()
 
     await state.clear()
     if not post:
@@ -898,83 +926,59 @@ async def edit_pick_level(call: CallbackQuery, settings: Settings, state: FSMCon
         await call.answer()
         return
     await call.message.edit_text(
-        f"✅ Уровень обновлён: <b>{post.level}</b>\n\n"
-        f"<b>Пост #{post.id}</b>\n"
-        f"⏰ {format_dt(post.send_at, settings.tz)}\n"
-        f"🎚 {post.level}\n"
-        f"📝 <b>{post.title or '(без названия)'}</b>\n\n"
-        f"{post.text}",
+        f"✅ Уровень обновлён: <b>{post.level}</b>\n\n" + _render_post_card(post, settings.tz),
         reply_markup=post_actions_kb(post.id),
     )
     await call.answer("Сохранено ✅")
 
 
 @admin_router.message(EditPostFSM.title)
-async def edit_title(message: Message, state: FSMContext, settings: Settings, session_factory):
-    if not _is_admin(message.from_user.id if message.from_user else None, settings):
-        return
+async def edit_title(message: Message, state: FSMContext, settings: Settings, db: AsyncSession):
     title = (message.text or "").strip()
     if not title:
         await message.answer("Название не должно быть пустым. Введите ещё раз:")
         return
     data = await state.get_data()
     post_id = int(data["post_id"])
-    db = session_factory()
-    try:
-        post = update_post_text_title(db, post_id, title=title)
-    finally:
-        db.close()
+    post = await update_post_text_title(db, post_id, title=title)
     await state.clear()
     await message.answer("✅ Название обновлено.")
     # show updated
     if post:
         await message.answer(
-            f"<b>Пост #{post.id}</b>\n"
-            f"⏰ {format_dt(post.send_at, settings.tz)}\n"
-            f"📝 <b>{post.title}</b>\n\n"
-            f"{post.text}",
+            _render_post_card(post, settings.tz),
             reply_markup=post_actions_kb(post.id),
         )
 
 
 @admin_router.message(EditPostFSM.text)
-async def edit_text(message: Message, state: FSMContext, settings: Settings, session_factory):
-    if not _is_admin(message.from_user.id if message.from_user else None, settings):
-        return
+async def edit_text(message: Message, state: FSMContext, settings: Settings, db: AsyncSession):
     # Preserve Telegram formatting: store HTML-rendered text (entities -> HTML)
-    text = message.html_text or message.text or ""
+    text = message.html_text
     if not text.strip():
         await message.answer("Текст не должен быть пустым. Введите ещё раз:")
         return
     data = await state.get_data()
     post_id = int(data["post_id"])
-    db = session_factory()
-    try:
-        post = update_post_text_title(db, post_id, text=text)
-    finally:
-        db.close()
-        await state.clear()
+    post = await update_post_text_title(db, post_id, text=text)
+    await state.clear()
 
     await message.answer("✅ Текст обновлён.")
     if post:
         await message.answer(
-            f"<b>Пост #{post.id}</b>\n"
-            f"⏰ {format_dt(post.send_at, settings.tz)}\n"
-            f"📝 <b>{post.title or '(без названия)'}</b>\n\n"
-            f"{post.text}",
+            _render_post_card(post, settings.tz),
             reply_markup=post_actions_kb(post.id),
         )
 
 
 @admin_router.message(EditPostFSM.content)
-async def edit_content(message: Message, state: FSMContext, settings: Settings, session_factory):
-    if not _is_admin(message.from_user.id if message.from_user else None, settings):
-        return
+async def edit_content(message: Message, state: FSMContext, settings: Settings, db: AsyncSession, session_factory):
     # Media group (album): collect photo/video items and finalize automatically after debounce
     if message.media_group_id and (message.photo or message.video):
         data = await state.get_data()
         album_id = data.get("album_id")
-        album_items = list(data.get("album_items") or [])
+        # no defensive copy: the list is written back with update_data() right below
+        album_items = data.get("album_items") or []
 
         if album_id and album_id != message.media_group_id:
             await message.answer("Вы начали новый альбом. Дождитесь завершения предыдущего (пару секунд) и попробуйте снова.")
@@ -983,12 +987,7 @@ async def edit_content(message: Message, state: FSMContext, settings: Settings,
         if not album_id:
             album_id = message.media_group_id
 
-        caption_html = (
-            getattr(message, "html_caption", None)
-            or getattr(message, "caption_html", None)
-            or message.caption
-            or ""
-        )
+        caption_html = message.html_text
         if caption_html.strip() and not (data.get("text") or "").strip():
             await state.update_data(text=caption_html)
 
@@ -1001,7 +1000,7 @@ async def edit_content(message: Message, state: FSMContext, settings: Settings,
         if len(album_items) == 1:
             await message.answer("✅ Альбом получаю… сейчас соберу все элементы и сохраню в пост.")
 
-        key = _album_key(message, "EditPostFSM.content")
+        key = _album_key(message)
         if key:
             async def _finalize():
                 d = await state.get_data()
@@ -1013,27 +1012,18 @@ async def edit_content(message: Message, state: FSMContext, settings: Settings,
                 if not items:
                     return
 
-                db = session_factory()
-                try:
-                    post = update_post_content(db, post_id, text=text, media_type=None, file_id=None, media_group=items)
-                    media_items = get_post_media(db, post_id)
-                finally:
-                    db.close()
+                async with session_factory() as db:
+                    post = await update_post_content(db, post_id, text=text, media_type=None, file_id=None, media_group=items)
 
                 await state.clear()
                 await message.answer("✅ Контент обновлён (медиагруппа).")
                 if post:
                     await message.answer(
-                        f"<b>Пост #{post.id}</b>\n"
-                        f"⏰ {format_dt(post.send_at, settings.tz)}\n"
-                        f"🎚 {post.level}\n"
-                        f"📎 media_group\n"
-                        f"📝 <b>{post.title or '(без названия)'}</b>\n\n"
-                        f"{post.text}",
+                        _render_post_card(post, settings.tz, media="media_group"),
                         reply_markup=post_actions_kb(post.id),
                     )
 
-            await _schedule_album_finalize(key=key, state=state, delay_sec=1.2, finalize_coro=_finalize)
+            _schedule_album_finalize(key=key, state=state, delay_sec=1.2, finalize_coro=_finalize)
             return
 
     # Single message: update immediately (preserve existing audio attachments)
@@ -1043,46 +1033,22 @@ async def edit_content(message: Message, state: FSMContext, settings: Settings,
         return
     data = await state.get_data()
     post_id = int(data["post_id"])
-    db = session_factory()
-    try:
-        existing = get_post_media(db, post_id)
-        keep_audio = [(it.media_type, it.file_id) for it in existing if it.media_type == "audio"]
-        new_media = [(media_type, file_id)] if (media_type and file_id) else []
-        post = update_post_content(db, post_id, text=text, media_type=None, file_id=None, media_group=(new_media + keep_audio))
-        media_items = get_post_media(db, post_id)
-    finally:
-        db.close()
+    existing = await get_post_media(db, post_id)
+    keep_audio = [(it.media_type, it.file_id) for it in existing if it.media_type == "audio"]
+    new_media = [(media_type, file_id)] if (media_type and file_id) else []
+    post = await update_post_content(db, post_id, text=text, media_type=None, file_id=None, media_group=(new_media + keep_audio))
     await state.clear()
     await message.answer("✅ Контент обновлён.")
     if post:
+        media_items = post.media_items
         media = "media_group" if media_items else (post.media_type or "text")
         await message.answer(
-            f"<b>Пост #{post.id}</b>\n"
-            f"⏰ {format_dt(post.send_at, settings.tz)}\n"
-            f"🎚 {post.level}\n"
-            f"📎 {media}\n"
-            f"📝 <b>{post.title or '(без названия)'}</b>\n\n"
-            f"{post.text}",
+            _render_post_card(post, settings.tz, media=media),
             reply_markup=post_actions_kb(post.id),
         )
         try:
             if media_items:
-                from aiogram.enums import ParseMode
-                from aiogram.types import InputMediaPhoto, InputMediaVideo
-
-                t = post.text or ""
-                caption = t if len(t) <= 1024 else ""
-                tail_text = "" if caption else t
-                album = []
-                for idx, item in enumerate(media_items):
-                    if item.media_type == "photo":
-                        album.append(InputMediaPhoto(media=item.file_id, caption=caption if idx == 0 else None, parse_mode=ParseMode.HTML if idx == 0 and caption else None))
-                    elif item.media_type == "video":
-                        album.append(InputMediaVideo(media=item.file_id, caption=caption if idx == 0 else None, parse_mode=ParseMode.HTML if idx == 0 and caption else None))
-                if album:
-                    await message.bot.send_media_group(chat_id=message.chat.id, media=album)
-                    if tail_text.strip():
-                        await message.answer(tail_text)
+                await _send_media_items_preview(message, post, media_items)
             else:
                 await _send_post_preview(message, post)
         except Exception:
@@ -1091,19 +1057,17 @@ async def edit_content(message: Message, state: FSMContext, settings: Settings,
 
 @admin_router.message(EditPostFSM.audio)
 async def edit_audio(message: Message, state: FSMContext, settings: Settings, session_factory):
-    if not _is_admin(message.from_user.id if message.from_user else None, settings):
-        return
     if not message.audio:
         await message.answer("Пришлите именно аудиофайл(ы).")
         return
 
     data = await state.get_data()
     post_id = int(data["post_id"])
-    audio_items = list(data.get("edit_audio_items") or [])
+    audio_items = data.get("edit_audio_items") or []
     audio_items.append(message.audio.file_id)
     await state.update_data(edit_audio_items=audio_items)
 
-    key = _album_key(message, "EditPostFSM.audio")
+    key = _album_key(message)
     if not key:
         return
 
@@ -1113,44 +1077,32 @@ async def edit_audio(message: Message, state: FSMContext, settings: Settings, se
         if not items:
             return
 
-        db = session_factory()
-        try:
-            post = get_post(db, post_id)
-            existing = get_post_media(db, post_id)
+        async with session_factory() as db:
+            existing = await get_post_media(db, post_id)
             keep_non_audio = [(it.media_type, it.file_id) for it in existing if it.media_type != "audio"]
             new_audio = [("audio", fid) for fid in items]
-            # keep text as-is
-            post = update_post_content(
+            post = await update_post_content(
                 db,
                 post_id,
-                text=(post.text if post else ""),
+                text=None,  # keep text as-is
                 media_type=None,
                 file_id=None,
                 media_group=(keep_non_audio + new_audio),
             )
-        finally:
-            db.close()
 
         await state.clear()
         await message.answer("✅ Аудио обновлено.")
         if post:
             await message.answer(
-                f"<b>Пост #{post.id}</b>\n"
-                f"⏰ {format_dt(post.send_at, settings.tz)}\n"
-                f"🎚 {post.level}\n"
-                f"📎 audio x{len(items)}\n"
-                f"📝 <b>{post.title or '(без названия)'}</b>\n\n"
-                f"{post.text}",
+                _render_post_card(post, settings.tz, media=f"audio x{len(items)}"),
                 reply_markup=post_actions_kb(post.id),
             )
 
-    await _schedule_album_finalize(key=key, state=state, delay_sec=1.2, finalize_coro=_finalize)
+    _schedule_album_finalize(key=key, state=state, delay_sec=1.2, finalize_coro=_finalize)
 
 
 @admin_router.message(EditPostFSM.send_at)
-async def edit_send_at(message: Message, state: FSMContext, settings: Settings, session_factory, scheduler: AsyncIOScheduler):
-    if not _is_admin(message.from_user.id if message.from_user else None, settings):
-        return
+async def edit_send_at(message: Message, state: FSMContext, settings: Settings, db: AsyncSession, session_factory, scheduler: AsyncIOScheduler):
     try:
         send_at = parse_moscow_datetime(message.text or "", settings.tz)
     except Exception:
@@ -1160,11 +1112,8 @@ async def edit_send_at(message: Message, state: FSMContext, settings: Settings,
     data = await state.get_data()
     post_id = int(data["post_id"])
 
-    db = session_factory()
-    try:
-        post = update_post_send_time(db, post_id, send_at=send_at)
-    finally:
-        db.close()
+    post = await update_post_send_time(db, post_id, send_at=send_at)
+    _invalidate_post_caches()
 
     await state.clear()
 
@@ -1172,7 +1121,7 @@ async def edit_send_at(message: Message, state: FSMContext, settings: Settings,
         await message.answer("Пост не найден.")
         return
 
-    schedule_or_send_now(bot=message.bot, scheduler=scheduler, session_factory=session_factory, post=post, tz=settings.tz)
     await message.answer(f"✅ Время обновлено: ⏰ {format_dt(post.send_at, settings.tz)}", reply_markup=post_actions_kb(post.id))
+    schedule_or_send_now(bot=message.bot, scheduler=scheduler, session_factory=session_factory, post=post, tz=settings.tz)
 
 
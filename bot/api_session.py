@@ -0,0 +1,75 @@
+import weakref
+from typing import Any
+
+import msgspec
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.methods.base import TelegramMethod, TelegramType
+from aiogram.types import InlineKeyboardMarkup, InputFile
+from aiohttp import FormData
+
+_encoder = msgspec.json.Encoder()
+
+# idle Bot API connections stay open this long (aiohttp's default is 15 s), so sends after a pause
+# (next broadcast, admin actions) reuse a warm TLS connection instead of handshaking again.
+# The pool size is aiogram's `limit` (100): enough for every broadcast worker plus polling.
+KEEPALIVE_TIMEOUT = 75
+
+
+def _json_dumps(obj: Any) -> str:
+    return _encoder.encode(obj).decode()
+
+
+class FastJsonSession(AiohttpSession):
+    """
+    Bot API session that encodes request JSON with msgspec and serializes every
+    InlineKeyboardMarkup object only once: keyboards from bot.keyboards are cached
+    and reused, so repeated sends of the same markup skip model_dump + encoding.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        kwargs.setdefault("json_dumps", _json_dumps)
+        super().__init__(**kwargs)
+        self._connector_init.setdefault("keepalive_timeout", KEEPALIVE_TIMEOUT)
+        # id(markup) -> (weak ref to the markup, encoded JSON); entries go away with the markup
+        self._markup_json: dict[int, tuple[weakref.ref, str]] = {}
+
+    def _forget_markup(self, key: int) -> None:
+        self._markup_json.pop(key, None)
+
+    def _encode_markup(self, markup: InlineKeyboardMarkup, bot: Bot, files: dict[str, Any]) -> str:
+        key = id(markup)
+        cached = self._markup_json.get(key)
+        if cached is not None and cached[0]() is markup:
+            return cached[1]
+        encoded = self.prepare_value(markup, bot, files)
+        ref = weakref.ref(markup, lambda _ref, key=key: self._forget_markup(key))
+        self._markup_json[key] = (ref, encoded)
+        return encoded
+
+    def preencode_markup(self, bot: Bot, markup: InlineKeyboardMarkup) -> str:
+        """
+        Serialize a keyboard ahead of a fan-out (e.g. the teaser "Open" button of a broadcast):
+        every send of this same object then reuses the stored JSON.
+        """
+        return self._encode_markup(markup, bot, {})
+
+    def build_form_data(self, bot: Bot, method: TelegramMethod[TelegramType]) -> FormData:
+        # The base implementation model_dumps the whole method first, so prepare_value only ever sees
+        # the markup as a plain dict. Keep the InlineKeyboardMarkup instance out of that dump instead
+        # and encode it through the per-object cache.
+        markup = getattr(method, "reply_markup", None)
+        if not isinstance(markup, InlineKeyboardMarkup):
+            return super().build_form_data(bot, method)
+
+        form = FormData(quote_fields=False)
+        files: dict[str, InputFile] = {}
+        for key, value in method.model_dump(warnings=False, exclude={"reply_markup"}).items():
+            value = self.prepare_value(value, bot=bot, files=files)
+            if not value:
+                continue
+            form.add_field(key, value)
+        form.add_field("reply_markup", self._encode_markup(markup, bot, files))
+        for key, value in files.items():
+            form.add_field(key, value.read(bot), filename=value.filename or key)
+        return form
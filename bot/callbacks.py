@@ -0,0 +1,45 @@
+from aiogram.filters.callback_data import CallbackData
+
+# Typed callback_data for the admin panel. Packed form is "<prefix>:<field>:<field>...",
+# so values must not contain ":" and the whole string must fit Telegram's 64 bytes.
+
+
+class DatesPageCB(CallbackData, prefix="dpage"):
+    page: int
+
+
+class AdminDateCB(CallbackData, prefix="adate"):
+    date: str  # YYYY-MM-DD
+
+
+class AdminLevelCB(CallbackData, prefix="alevel"):
+    level: str
+
+
+class PostListCB(CallbackData, prefix="plist"):
+    ctx: str  # "d" (date) / "l" (level)
+    ctx_value: str
+    page: int
+    cursor: str  # see bot.keyboards.FIRST_PAGE_CURSOR
+
+
+class PostOpenCB(CallbackData, prefix="post"):
+    id: int
+    # list the post was opened from (for the "back" button)
+    ctx: str | None = None
+    ctx_value: str | None = None
+    page: int | None = None
+    cursor: str | None = None
+
+
+class PostActCB(CallbackData, prefix="pact"):
+    action: str
+    post_id: int
+
+
+class PostLevelCB(CallbackData, prefix="plevel"):
+    level: str
+
+
+class DraftCB(CallbackData, prefix="cdraft"):
+    action: str
@@ -6,26 +6,36 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-def _parse_admin_ids(raw: str) -> set[int]:
+def _parse_admin_ids(raw: str) -> frozenset[int]:
     if not raw:
-        return set()
+        return frozenset()
     ids: set[int] = set()
     for part in raw.split(","):
         part = part.strip()
         if not part:
             continue
         ids.add(int(part))
-    return ids
+    return frozenset(ids)
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    return int(raw) if raw else default
 
 
 @dataclass(frozen=True)
 class Settings:
     bot_token: str
-    admin_ids: set[int]
+    admin_ids: frozenset[int]
     tz: str
     database_url: str
     seed_json_path: str
     seed_on_start: bool
+    # SQLAlchemy connection pool
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 3600
 
 
 def load_settings() -> Settings:
@@ -47,6 +57,10 @@ def load_settings() -> Settings:
         database_url=database_url,
         seed_json_path=seed_json_path,
         seed_on_start=seed_on_start,
+        db_pool_size=_env_int("DB_POOL_SIZE", 20),
+        db_max_overflow=_env_int("DB_MAX_OVERFLOW", 10),
+        db_pool_timeout=_env_int("DB_POOL_TIMEOUT", 30),
+        db_pool_recycle=_env_int("DB_POOL_RECYCLE", 3600),
     )
 
 
@@ -1,20 +1,35 @@
 import datetime as dt
 import os
+import time
+from collections.abc import AsyncIterator
 from typing import Optional
 
 from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
+    Row,
     String,
     Text,
-    create_engine,
+    Select,
+    and_,
+    or_,
     select,
     func,
     delete,
+    event,
+    inspect,
+    update,
 )
-from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, joinedload, load_only, mapped_column, relationship
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 
 class Base(DeclarativeBase):
@@ -31,7 +46,7 @@ class User(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     telegram_id: Mapped[int] = mapped_column(Integer, unique=True, index=True, nullable=False)
     level: Mapped[Optional[Level]] = mapped_column(String(20), nullable=True, index=True)
-    joined_at: Mapped[dt.datetime] = mapped_column(DateTime(), default=lambda: dt.datetime.now())
+    joined_at: Mapped[dt.datetime] = mapped_column(DateTime(), default=dt.datetime.now)
 
 
 class Post(Base):
@@ -44,10 +59,31 @@ class Post(Base):
     media_type: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, index=True)
     file_id: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     send_at: Mapped[dt.datetime] = mapped_column(DateTime(), nullable=False, index=True)
-    sent: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    sent: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     sent_at: Mapped[Optional[dt.datetime]] = mapped_column(DateTime(), nullable=True)
-    created_at: Mapped[dt.datetime] = mapped_column(DateTime(), default=lambda: dt.datetime.now())
-    updated_at: Mapped[dt.datetime] = mapped_column(DateTime(), default=lambda: dt.datetime.now())
+    # broadcast result, written together with sent/sent_at
+    delivered: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    total: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[dt.datetime] = mapped_column(DateTime(), default=dt.datetime.now)
+    updated_at: Mapped[dt.datetime] = mapped_column(DateTime(), default=dt.datetime.now)
+
+    # album items in display order; never lazy-loaded (async), load with joinedload/selectinload
+    media_items: Mapped[list["PostMedia"]] = relationship(
+        order_by=lambda: (PostMedia.position, PostMedia.id),
+        lazy="raise",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        # admin "posts by level" list: keyset seek over (send_at, id) within a level
+        Index("ix_posts_level_send_at", "level", "send_at", "id"),
+        # scheduler startup: unsent posts before/after now -> range scan over the unsent part only
+        Index("ix_posts_sent_send_at", "sent", "send_at"),
+    )
+
+
+# admin "posts by date": distinct dates and the per-date list both filter on date(send_at)
+Index("ix_posts_send_date", func.date(Post.send_at), Post.send_at, Post.id)
 
 
 class PostMedia(Base):
@@ -67,6 +103,20 @@ class PostMedia(Base):
     position: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
 
 
+class DeliveryLog(Base):
+    """
+    Per-recipient result of a broadcast (written in bulk when the broadcast ends, see record_deliveries).
+    """
+
+    __tablename__ = "delivery_log"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    post_id: Mapped[int] = mapped_column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), index=True, nullable=False)
+    telegram_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    delivered: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(DateTime(), default=dt.datetime.now)
+
+
 class BroadcastSettings(Base):
     __tablename__ = "broadcast_settings"
 
@@ -74,287 +124,553 @@ class BroadcastSettings(Base):
     teaser_text: Mapped[str] = mapped_column(Text, default="", nullable=False)
     teaser_media_type: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     teaser_file_id: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    updated_at: Mapped[dt.datetime] = mapped_column(DateTime(), default=lambda: dt.datetime.now())
+    updated_at: Mapped[dt.datetime] = mapped_column(DateTime(), default=dt.datetime.now)
+
+
+class SchemaMeta(Base):
+    """
+    One row: version of the schema the database was last brought up to (see init_db).
+    """
+    __tablename__ = "schema_meta"
+
+    version: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+
+# Bump when tables, columns or indexes change: init_db() re-runs the compat checks only then.
+SCHEMA_VERSION = 4
+
+# indexes replaced by newer ones; dropped when the schema version changes
+_OBSOLETE_INDEXES = ("ix_posts_sent",)
+
+
+def _async_database_url(database_url: str) -> str:
+    # Settings keep the plain sync URL; the engine needs an async driver.
+    if database_url.startswith("sqlite:///"):
+        return "sqlite+aiosqlite:///" + database_url[len("sqlite:///"):]
+    for prefix in ("postgresql://", "postgres://"):
+        if database_url.startswith(prefix):
+            return "postgresql+asyncpg://" + database_url[len(prefix):]
+    return database_url
 
 
-def make_engine(database_url: str):
+def make_engine(
+    database_url: str,
+    *,
+    pool_size: int = 20,
+    max_overflow: int = 10,
+    pool_timeout: int = 30,
+    pool_recycle: int = 3600,
+) -> AsyncEngine:
     # Ensure local folder exists for sqlite relative path
     if database_url.startswith("sqlite:///./"):
         os.makedirs("bot_data", exist_ok=True)
-    return create_engine(database_url, future=True)
+    # A queue pool for sqlite too: aiosqlite runs each connection in its own thread, so a shared
+    # StaticPool connection would serialize (and interleave) concurrent sessions.
+    engine = create_async_engine(
+        _async_database_url(database_url),
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=True,
+    )
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    # WAL: readers don't block the writer (and vice versa); NORMAL is durable enough with WAL
+    # and avoids an fsync per commit.
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+def make_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
 
+def _drop_outdated_tables(conn) -> None:
+    """
+    Simple compatibility check: if an old schema exists (from previous iterations),
+    recreate our tables to avoid runtime "no such column" errors.
+    Runs on a sync connection via AsyncConnection.run_sync().
+    """
+    def table_columns(table: str) -> set[str]:
+        rows = conn.exec_driver_sql(f"PRAGMA table_info({table})").fetchall()
+        return {r[1] for r in rows}  # (cid, name, type, notnull, dflt_value, pk)
+
+    # posts
+    posts_cols = table_columns("posts")
+    expected_posts = {"id", "title", "level", "text", "media_type", "file_id", "send_at", "sent", "sent_at", "created_at", "updated_at"}
+    if posts_cols and not expected_posts.issubset(posts_cols):
+        conn.exec_driver_sql("DROP TABLE IF EXISTS posts")
+
+    # users
+    users_cols = table_columns("users")
+    expected_users = {"id", "telegram_id", "level", "joined_at"}
+    if users_cols and not expected_users.issubset(users_cols):
+        conn.exec_driver_sql("DROP TABLE IF EXISTS users")
+
+    # broadcast_settings
+    bs_cols = table_columns("broadcast_settings")
+    expected_bs = {"id", "teaser_text", "teaser_media_type", "teaser_file_id", "updated_at"}
+    if bs_cols and not expected_bs.issubset(bs_cols):
+        conn.exec_driver_sql("DROP TABLE IF EXISTS broadcast_settings")
+
+    # post_media (albums)
+    pm_cols = table_columns("post_media")
+    expected_pm = {"id", "post_id", "media_type", "file_id", "position"}
+    if pm_cols and not expected_pm.issubset(pm_cols):
+        conn.exec_driver_sql("DROP TABLE IF EXISTS post_media")
+
+
+def _add_missing_columns(conn) -> None:
+    # create_all() doesn't alter existing tables: add new nullable columns in place
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        existing = {c["name"] for c in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing and column.nullable:
+                col_type = column.type.compile(dialect=conn.dialect)
+                conn.exec_driver_sql(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}")
+
+
+def _create_missing_indexes(conn) -> None:
+    # IF NOT EXISTS rather than checkfirst: reflection doesn't see expression indexes
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+def _sync_schema(conn) -> None:
+    SchemaMeta.__table__.create(conn, checkfirst=True)
+    version = conn.scalar(select(SchemaMeta.version))
+    if version == SCHEMA_VERSION:
+        # up to date: only make sure no table went missing
+        Base.metadata.create_all(conn)
+        return
 
-def make_session_factory(engine):
-    return sessionmaker(bind=engine, expire_on_commit=False, class_=Session, future=True)
+    if conn.dialect.name == "sqlite":
+        # PRAGMA table_info is sqlite-only
+        _drop_outdated_tables(conn)
+    Base.metadata.create_all(conn)
+    _add_missing_columns(conn)
+    # create_all() skips tables that already exist, including their new indexes
+    _create_missing_indexes(conn)
+    for name in _OBSOLETE_INDEXES:
+        conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+    conn.execute(delete(SchemaMeta))
+    conn.execute(SchemaMeta.__table__.insert().values(version=SCHEMA_VERSION))
 
 
-def init_db(engine) -> None:
+async def init_db(engine: AsyncEngine) -> None:
     os.makedirs("bot_data", exist_ok=True)
-    Base.metadata.create_all(bind=engine)
-
-    # Simple compatibility check: if an old schema exists (from previous iterations),
-    # recreate our tables to avoid runtime "no such column" errors.
-    try:
-        with engine.connect() as conn:
-            def table_columns(table: str) -> set[str]:
-                rows = conn.exec_driver_sql(f"PRAGMA table_info({table})").fetchall()
-                return {r[1] for r in rows}  # (cid, name, type, notnull, dflt_value, pk)
-
-            # posts
-            posts_cols = table_columns("posts")
-            expected_posts = {"id", "title", "level", "text", "media_type", "file_id", "send_at", "sent", "sent_at", "created_at", "updated_at"}
-            if posts_cols and not expected_posts.issubset(posts_cols):
-                conn.exec_driver_sql("DROP TABLE IF EXISTS posts")
-
-            # users
-            users_cols = table_columns("users")
-            expected_users = {"id", "telegram_id", "level", "joined_at"}
-            if users_cols and not expected_users.issubset(users_cols):
-                conn.exec_driver_sql("DROP TABLE IF EXISTS users")
-
-            # broadcast_settings
-            bs_cols = table_columns("broadcast_settings")
-            expected_bs = {"id", "teaser_text", "teaser_media_type", "teaser_file_id", "updated_at"}
-            if bs_cols and not expected_bs.issubset(bs_cols):
-                conn.exec_driver_sql("DROP TABLE IF EXISTS broadcast_settings")
-
-            # post_media (albums)
-            pm_cols = table_columns("post_media")
-            expected_pm = {"id", "post_id", "media_type", "file_id", "position"}
-            if pm_cols and not expected_pm.issubset(pm_cols):
-                conn.exec_driver_sql("DROP TABLE IF EXISTS post_media")
-
-            conn.commit()
-    except Exception:
-        # don't block startup if PRAGMA isn't available (non-sqlite)
-        pass
-
-    Base.metadata.create_all(bind=engine)
-
-
-def upsert_user(db: Session, telegram_id: int) -> User:
-    user = db.scalar(select(User).where(User.telegram_id == telegram_id))
-    if user:
-        return user
-    user = User(telegram_id=telegram_id)
-    db.add(user)
-    db.commit()
-    return user
+    async with engine.begin() as conn:
+        await conn.run_sync(_sync_schema)
 
 
-def set_user_level(db: Session, telegram_id: int, level: Level) -> User:
-    user = db.scalar(select(User).where(User.telegram_id == telegram_id))
-    if not user:
-        user = User(telegram_id=telegram_id, level=level)
-        db.add(user)
-        db.commit()
-        return user
-    user.level = level
-    db.commit()
-    return user
+def _insert(db: AsyncSession, table):
+    # INSERT ... ON CONFLICT is dialect-specific in SQLAlchemy
+    if db.bind.dialect.name == "postgresql":
+        return pg_insert(table)
+    return sqlite_insert(table)
 
 
-def get_all_users(db: Session) -> list[User]:
-    return list(db.scalars(select(User)))
+async def upsert_user(db: AsyncSession, telegram_id: int) -> bool:
+    """
+    Registers the user in one statement. -> True if the user is new.
+    """
+    stmt = (
+        _insert(db, User)
+        .values(telegram_id=telegram_id)
+        .on_conflict_do_nothing(index_elements=[User.telegram_id])
+        .returning(User.id)
+    )
+    created = (await db.execute(stmt)).scalar_one_or_none() is not None
+    await db.commit()
+    return created
 
 
-def get_users_by_level(db: Session, level: Level) -> list[User]:
-    return list(db.scalars(select(User).where(User.level == level)))
+async def set_user_level(db: AsyncSession, telegram_id: int, level: Level) -> User:
+    stmt = (
+        _insert(db, User)
+        .values(telegram_id=telegram_id, level=level)
+        .on_conflict_do_update(index_elements=[User.telegram_id], set_={"level": level})
+        .returning(User)
+        .execution_options(populate_existing=True)
+    )
+    user = (await db.execute(stmt)).scalar_one()
+    await db.commit()
+    return user
+
+
+async def iter_user_ids(db: AsyncSession, level: Optional[Level] = None) -> AsyncIterator[int]:
+    """
+    Streams telegram ids of all users (or of one level) in batches, without building User objects.
+    """
+    stmt = select(User.telegram_id).execution_options(yield_per=500)
+    if level is not None:
+        stmt = stmt.where(User.level == level)
+    async for telegram_id in await db.stream_scalars(stmt):
+        yield telegram_id
 
 
-def count_users(db: Session) -> int:
-    return int(db.scalar(select(func.count()).select_from(User)) or 0)
+async def count_users(db: AsyncSession) -> int:
+    return int(await db.scalar(select(func.count()).select_from(User)) or 0)
 
 
-def create_post(db: Session, title: str, text: str, send_at: dt.datetime, level: PostLevel = "all") -> Post:
+async def create_post(
+    db: AsyncSession,
+    title: str,
+    text: str,
+    send_at: dt.datetime,
+    level: PostLevel = "all",
+    *,
+    media_group: Optional[list[tuple[str, str]]] = None,
+) -> Post:
+    """
+    Insert a post together with its media items (list of (media_type, file_id)) in one transaction.
+    """
     post = Post(title=title.strip(), text=text, send_at=send_at, level=level, sent=False, media_type=None, file_id=None)
     db.add(post)
-    db.commit()
+    if media_group:
+        await db.flush()  # assigns post.id
+        for idx, (media_type, file_id) in enumerate(media_group):
+            db.add(PostMedia(post_id=post.id, media_type=media_type, file_id=file_id, position=idx))
+    await db.commit()
     return post
 
 
-def get_post(db: Session, post_id: int) -> Optional[Post]:
-    return db.scalar(select(Post).where(Post.id == post_id))
+# Columns needed to render/deliver a post; skips created_at/updated_at/sent_at.
+_POST_VIEW_COLUMNS = (
+    Post.id,
+    Post.title,
+    Post.text,
+    Post.send_at,
+    Post.level,
+    Post.media_type,
+    Post.file_id,
+    Post.sent,
+    Post.delivered,
+    Post.total,
+)
 
 
-def get_post_media(db: Session, post_id: int) -> list[PostMedia]:
+async def get_post(db: AsyncSession, post_id: int) -> Optional[Row]:
+    """
+    Read-only view of a post (a Row with attribute access), fetched in one SELECT.
+    Use db.get(Post, ...) when the ORM instance is needed for changes.
+    """
+    return (await db.execute(select(*_POST_VIEW_COLUMNS).where(Post.id == post_id))).one_or_none()
+
+
+async def get_post_with_media(db: AsyncSession, post_id: int) -> Optional[Post]:
+    """
+    The post (view columns only) with .media_items populated, in one SELECT ... LEFT JOIN post_media.
+    """
+    stmt = (
+        select(Post)
+        .options(load_only(*_POST_VIEW_COLUMNS), joinedload(Post.media_items))
+        .where(Post.id == post_id)
+    )
+    return (await db.scalars(stmt)).unique().one_or_none()
+
+
+# Short-lived cache for the user "open post" button: a teaser broadcast makes many users press
+# it at once for the same post. Writes to a post drop its entry (see _forget_post).
+POST_CACHE_TTL = 5.0
+_POST_CACHE_MAX = 512
+_post_cache: dict[int, tuple[float, Post]] = {}
+
+
+def _forget_post(post_id: int) -> None:
+    _post_cache.pop(post_id, None)
+
+
+async def get_post_cached(db: AsyncSession, post_id: int, ttl: float = POST_CACHE_TTL) -> Optional[Post]:
+    """
+    get_post_with_media() behind a per-post TTL cache. The result is read-only.
+    """
+    now = time.monotonic()
+    cached = _post_cache.get(post_id)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    post = await get_post_with_media(db, post_id)
+    _forget_post(post_id)
+    if post is None:
+        return None
+    if len(_post_cache) >= _POST_CACHE_MAX:
+        # drop the oldest entry (dicts keep insertion order)
+        _post_cache.pop(next(iter(_post_cache)))
+    _post_cache[post_id] = (now, post)
+    return post
+
+
+async def get_post_media(db: AsyncSession, post_id: int) -> list[PostMedia]:
     stmt = select(PostMedia).where(PostMedia.post_id == post_id).order_by(PostMedia.position.asc(), PostMedia.id.asc())
-    return list(db.scalars(stmt))
+    return list(await db.scalars(stmt))
 
 
-def replace_post_media_group(db: Session, post_id: int, items: list[tuple[str, str]]) -> None:
+async def replace_post_media_group(db: AsyncSession, post_id: int, items: list[tuple[str, str]]) -> list[PostMedia]:
     """
-    Replace post media group with new items.
+    Replace post media group with new items; returns them in order.
     items: list of (media_type, file_id), where media_type is "photo" or "video".
     """
+    _forget_post(post_id)
     # Clear existing album items
-    db.execute(delete(PostMedia).where(PostMedia.post_id == post_id))
+    await db.execute(delete(PostMedia).where(PostMedia.post_id == post_id))
     # Insert new items
-    for idx, (media_type, file_id) in enumerate(items):
-        db.add(PostMedia(post_id=post_id, media_type=media_type, file_id=file_id, position=idx))
-    db.commit()
+    media = [
+        PostMedia(post_id=post_id, media_type=media_type, file_id=file_id, position=idx)
+        for idx, (media_type, file_id) in enumerate(items)
+    ]
+    db.add_all(media)
+    await db.commit()
+    return media
 
 
-def get_posts(db: Session, limit: int = 50) -> list[Post]:
+async def get_posts(db: AsyncSession, limit: int = 50) -> list[Post]:
     stmt = select(Post).order_by(Post.send_at.desc(), Post.id.desc()).limit(limit)
-    return list(db.scalars(stmt))
+    return list(await db.scalars(stmt))
 
 
-def get_post_dates(db: Session) -> list[str]:
+async def get_post_dates(db: AsyncSession) -> list[str]:
     """
     Returns distinct send_at dates as YYYY-MM-DD strings (sorted desc).
     SQLite-compatible via func.date().
     """
     stmt = select(func.date(Post.send_at)).distinct().order_by(func.date(Post.send_at).desc())
-    return [str(x) for x in db.scalars(stmt).all() if x]
-
+    return [str(x) for x in (await db.scalars(stmt)).all() if x]
 
-def count_posts_by_date(db: Session, date_str: str) -> int:
-    stmt = select(func.count()).select_from(Post).where(func.date(Post.send_at) == date_str)
-    return int(db.scalar(stmt) or 0)
 
-
-def get_posts_by_date(db: Session, date_str: str, *, limit: int, offset: int) -> list[Post]:
-    stmt = (
-        select(Post)
-        .where(func.date(Post.send_at) == date_str)
-        .order_by(Post.send_at.asc(), Post.id.asc())
-        .limit(limit)
-        .offset(offset)
-    )
-    return list(db.scalars(stmt))
+PostCursor = tuple[dt.datetime, int]  # (send_at, id) of a boundary row
 
 
-def count_posts_by_level(db: Session, level: PostLevel) -> int:
-    stmt = select(func.count()).select_from(Post).where(Post.level == level)
-    return int(db.scalar(stmt) or 0)
+def _seek_page(stmt: Select, *, limit: int, after: Optional[PostCursor], before: Optional[PostCursor]) -> Select:
+    """
+    Keyset pagination over (send_at, id).
+    `after` pages forward from a row, `before` pages backward; without either the first page is returned.
+    """
+    if before is not None:
+        ts, post_id = before
+        return (
+            stmt.where(or_(Post.send_at < ts, and_(Post.send_at == ts, Post.id < post_id)))
+            .order_by(Post.send_at.desc(), Post.id.desc())
+            .limit(limit)
+        )
+    if after is not None:
+        ts, post_id = after
+        stmt = stmt.where(or_(Post.send_at > ts, and_(Post.send_at == ts, Post.id > post_id)))
+    return stmt.order_by(Post.send_at.asc(), Post.id.asc()).limit(limit)
+
+
+async def _fetch_page(
+    db: AsyncSession, stmt: Select, *, limit: int, after: Optional[PostCursor], before: Optional[PostCursor]
+) -> list[Post]:
+    posts = list(await db.scalars(_seek_page(stmt, limit=limit, after=after, before=before)))
+    if before is not None:
+        posts.reverse()
+    return posts
+
+
+async def get_posts_by_date(
+    db: AsyncSession,
+    date_str: str,
+    *,
+    limit: int,
+    after: Optional[PostCursor] = None,
+    before: Optional[PostCursor] = None,
+) -> list[Post]:
+    """
+    Returns up to `limit` posts of the date in (send_at, id) order.
+    When paging backward (`before`), the extra row (if any) is the first one.
+    """
+    stmt = select(Post).where(func.date(Post.send_at) == date_str)
+    return await _fetch_page(db, stmt, limit=limit, after=after, before=before)
 
 
-def get_posts_by_level(db: Session, level: PostLevel, *, limit: int, offset: int) -> list[Post]:
-    stmt = (
-        select(Post)
-        .where(Post.level == level)
-        .order_by(Post.send_at.asc(), Post.id.asc())
-        .limit(limit)
-        .offset(offset)
-    )
-    return list(db.scalars(stmt))
+async def get_posts_by_level(
+    db: AsyncSession,
+    level: PostLevel,
+    *,
+    limit: int,
+    after: Optional[PostCursor] = None,
+    before: Optional[PostCursor] = None,
+) -> list[Post]:
+    """
+    Same paging contract as get_posts_by_date().
+    """
+    stmt = select(Post).where(Post.level == level)
+    return await _fetch_page(db, stmt, limit=limit, after=after, before=before)
 
 
-def get_broadcast_settings(db: Session) -> BroadcastSettings:
-    s = db.get(BroadcastSettings, 1)
+async def get_broadcast_settings(db: AsyncSession) -> BroadcastSettings:
+    s = await db.get(BroadcastSettings, 1)
     if s:
         return s
     s = BroadcastSettings(id=1, teaser_text="", teaser_media_type=None, teaser_file_id=None)
     db.add(s)
-    db.commit()
+    await db.commit()
     return s
 
 
-def set_teaser_content(db: Session, *, text: str, media_type: Optional[str], file_id: Optional[str]) -> BroadcastSettings:
-    s = get_broadcast_settings(db)
+# The teaser is read by every broadcast but changes only when an admin edits it (set_teaser_content
+# drops the cached copy).
+BROADCAST_SETTINGS_TTL = 5.0
+_settings_cache: Optional[tuple[float, BroadcastSettings]] = None
+
+
+async def get_broadcast_settings_cached(db: AsyncSession, ttl: float = BROADCAST_SETTINGS_TTL) -> BroadcastSettings:
+    """
+    get_broadcast_settings() behind a short TTL cache. The result is read-only.
+    """
+    global _settings_cache
+    now = time.monotonic()
+    if _settings_cache is not None and now - _settings_cache[0] < ttl:
+        return _settings_cache[1]
+    s = await get_broadcast_settings(db)
+    _settings_cache = (now, s)
+    return s
+
+
+async def set_teaser_content(db: AsyncSession, *, text: str, media_type: Optional[str], file_id: Optional[str]) -> BroadcastSettings:
+    global _settings_cache
+    _settings_cache = None
+    s = await get_broadcast_settings(db)
     s.teaser_text = text
     s.teaser_media_type = media_type
     s.teaser_file_id = file_id
     s.updated_at = dt.datetime.now()
-    db.commit()
+    await db.commit()
     return s
 
 
-def get_unsent_future_posts(db: Session, now: dt.datetime) -> list[Post]:
+async def get_unsent_future_posts(db: AsyncSession, now: dt.datetime) -> list[Post]:
     stmt = select(Post).where(Post.sent == False, Post.send_at > now)  # noqa: E712
-    return list(db.scalars(stmt))
+    return list(await db.scalars(stmt))
 
 
-def get_unsent_due_posts(db: Session, now: dt.datetime) -> list[Post]:
-    stmt = select(Post).where(Post.sent == False, Post.send_at <= now)  # noqa: E712
-    return list(db.scalars(stmt))
+async def get_unsent_due_posts(db: AsyncSession, now: dt.datetime) -> list[Post]:
+    stmt = select(Post).where(Post.sent == False, Post.send_at <= now).order_by(Post.send_at, Post.id)  # noqa: E712
+    return list(await db.scalars(stmt))
 
 
-def update_post_text_title(db: Session, post_id: int, *, title: Optional[str] = None, text: Optional[str] = None) -> Optional[Post]:
-    post = get_post(db, post_id)
-    if not post:
-        return None
+async def _update_post(db: AsyncSession, post_id: int, **values) -> Optional[Post]:
+    """
+    UPDATE ... RETURNING: mutates the row and returns it in one round-trip (None if not found).
+    Does not commit.
+    """
+    _forget_post(post_id)
+    stmt = (
+        update(Post)
+        .where(Post.id == post_id)
+        .values(updated_at=dt.datetime.now(), **values)
+        .returning(Post)
+        .execution_options(populate_existing=True)
+    )
+    return (await db.scalars(stmt)).one_or_none()
+
+
+async def update_post_text_title(db: AsyncSession, post_id: int, *, title: Optional[str] = None, text: Optional[str] = None) -> Optional[Post]:
+    values: dict[str, str] = {}
     if title is not None:
-        post.title = title.strip()
+        values["title"] = title.strip()
     if text is not None:
-        post.text = text
-    post.updated_at = dt.datetime.now()
-    db.commit()
+        values["text"] = text
+    post = await _update_post(db, post_id, **values)
+    await db.commit()
     return post
 
 
-def update_post_content(
-    db: Session,
+async def update_post_content(
+    db: AsyncSession,
     post_id: int,
     *,
-    text: str,
+    text: Optional[str],
     media_type: Optional[str],
     file_id: Optional[str],
     media_group: Optional[list[tuple[str, str]]] = None,
 ) -> Optional[Post]:
-    post = get_post(db, post_id)
-    if not post:
-        return None
-    post.text = text
+    """
+    text=None keeps the current text.
+    The returned post has .media_items set to the new items (no extra SELECT).
+    """
+    values = {} if text is None else {"text": text}
     if media_group:
         # Store as media group: clear single-media fields and write PostMedia items
-        post.media_type = None
-        post.file_id = None
-        post.updated_at = dt.datetime.now()
-        db.commit()
-        replace_post_media_group(db, post_id, media_group)
-        # Reload post in current session state
-        post = get_post(db, post_id)
+        post = await _update_post(db, post_id, media_type=None, file_id=None, **values)
+        if not post:
+            await db.rollback()
+            return None
+        media = await replace_post_media_group(db, post_id, media_group)
+        set_committed_value(post, "media_items", media)
         return post
 
     # Store as single media (or text-only): clear any existing album items
-    db.execute(delete(PostMedia).where(PostMedia.post_id == post_id))
-    post.media_type = media_type
-    post.file_id = file_id
-    post.updated_at = dt.datetime.now()
-    db.commit()
+    post = await _update_post(db, post_id, media_type=media_type, file_id=file_id, **values)
+    if post:
+        await db.execute(delete(PostMedia).where(PostMedia.post_id == post_id))
+        set_committed_value(post, "media_items", [])
+    await db.commit()
     return post
 
 
-def update_post_send_time(db: Session, post_id: int, send_at: dt.datetime) -> Optional[Post]:
-    post = get_post(db, post_id)
-    if not post:
-        return None
-    post.send_at = send_at
-    post.sent = False
-    post.sent_at = None
-    post.updated_at = dt.datetime.now()
-    db.commit()
+async def update_post_send_time(db: AsyncSession, post_id: int, send_at: dt.datetime) -> Optional[Post]:
+    post = await _update_post(db, post_id, send_at=send_at, sent=False, sent_at=None, delivered=None, total=None)
+    await db.commit()
     return post
 
 
-def update_post_level(db: Session, post_id: int, level: PostLevel) -> Optional[Post]:
-    post = get_post(db, post_id)
-    if not post:
-        return None
-    post.level = level
-    post.updated_at = dt.datetime.now()
-    db.commit()
+async def update_post_level(db: AsyncSession, post_id: int, level: PostLevel) -> Optional[Post]:
+    post = await _update_post(db, post_id, level=level)
+    await db.commit()
     return post
 
 
-def delete_post(db: Session, post_id: int) -> bool:
-    post = get_post(db, post_id)
-    if not post:
+async def delete_post(db: AsyncSession, post_id: int) -> bool:
+    _forget_post(post_id)
+    # Best-effort: remove album items and delivery results too
+    await db.execute(delete(PostMedia).where(PostMedia.post_id == post_id))
+    await db.execute(delete(DeliveryLog).where(DeliveryLog.post_id == post_id))
+    deleted = (await db.execute(delete(Post).where(Post.id == post_id).returning(Post.id))).scalar_one_or_none()
+    if deleted is None:
+        await db.rollback()
         return False
-    # Best-effort: remove album items too
-    db.execute(delete(PostMedia).where(PostMedia.post_id == post_id))
-    db.delete(post)
-    db.commit()
+    await db.commit()
     return True
 
 
-def mark_post_sent(db: Session, post_id: int, sent_at: dt.datetime) -> None:
-    post = get_post(db, post_id)
-    if not post:
-        return
-    post.sent = True
-    post.sent_at = sent_at
-    post.updated_at = dt.datetime.now()
-    db.commit()
+# rows per INSERT statement when writing delivery results
+_DELIVERY_LOG_CHUNK = 1000
+
+
+async def record_deliveries(db: AsyncSession, post_id: int, results: list[tuple[int, bool]]) -> None:
+    """
+    Bulk-insert (telegram_id, delivered) results of a broadcast: one executemany per chunk,
+    no ORM objects. Does not commit (mark_post_sent does).
+    """
+    now = dt.datetime.now()
+    for start in range(0, len(results), _DELIVERY_LOG_CHUNK):
+        rows = [
+            {"post_id": post_id, "telegram_id": telegram_id, "delivered": ok, "created_at": now}
+            for telegram_id, ok in results[start:start + _DELIVERY_LOG_CHUNK]
+        ]
+        await db.execute(DeliveryLog.__table__.insert(), rows)
+
+
+async def mark_post_sent(
+    db: AsyncSession,
+    post_id: int,
+    sent_at: dt.datetime,
+    *,
+    delivered: Optional[int] = None,
+    total: Optional[int] = None,
+) -> None:
+    await _update_post(db, post_id, sent=True, sent_at=sent_at, delivered=delivered, total=total)
+    await db.commit()
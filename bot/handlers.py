@@ -1,37 +1,31 @@
 from aiogram import Router
 from aiogram.filters import BaseFilter
 from aiogram.filters import Command
-from aiogram.types import CallbackQuery, Message
+from aiogram.enums import ParseMode
+from aiogram.types import CallbackQuery, InputMediaPhoto, InputMediaVideo, Message
 from aiogram import F
 import asyncio
 import datetime as dt
-from zoneinfo import ZoneInfo
 import re
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from bot.config import Settings
-from bot.db import get_post, get_post_media, set_user_level, upsert_user
+from bot.db import get_post_cached, set_user_level, upsert_user
 from bot.keyboards import LEVELS, user_level_kb
+from bot.ratelimit import limited
+from bot.recipients import invalidate_recipients
+from bot.time_utils import get_tz
 
 router = Router()
 
+# characters not allowed in the @nick tag of forwarded messages
+_USERNAME_UNSAFE = re.compile(r"[^0-9A-Za-z_]")
+# "/cmd" after optional leading whitespace; matched in place, no stripped copy of the text
+_COMMAND_RE = re.compile(r"\s*/")
 
-@router.message(Command("start"))
-async def cmd_start(message: Message, session_factory):
-    """
-    Minimal user entrypoint:
-    - registers user in DB so they can receive scheduled posts
-    """
-    if not message.from_user:
-        return
-    db = session_factory()
-    try:
-        upsert_user(db, telegram_id=message.from_user.id)
-    finally:
-        db.close()
-
-    # Day 0 intro + level selection
-    await message.answer(
-        """🎄 <b>New Year English Challenge with Angie</b>
+# /start: Day 0 intro + rules
+_WELCOME_INTRO = """🎄 <b>New Year English Challenge with Angie</b>
 
 Добро пожаловать в новогодний English-челлендж!
 
@@ -41,10 +35,8 @@ It’s my New Year present for you! 🎁
 
 I want your holidays to be fun, festive and useful for your English.
 Hope you’ll enjoy it as much as I enjoyed creating it for you!☺️"""
-    )
-    await asyncio.sleep(3)
-    await message.answer(
-        """✨ <b>Как всё устроено</b>
+
+_WELCOME_RULES = """✨ <b>Как всё устроено</b>
 
 Челлендж начинается <b>29 декабря</b> и продолжается до <b>7 января</b>. Каждый день ты будешь получать от меня маленькое задание или приятное новогоднее сообщение💙 и, конечно, будут подарки!🎁
 
@@ -59,27 +51,41 @@ Hope you’ll enjoy it as much as I enjoyed creating it for you!☺️"""
 
 Получается такой  небольшой новогодний адвент к православному Рождеству 🎄с практикой английского, теплом и подарками 🎀
         """
-    )
+
+
+@router.message(Command("start"))
+async def cmd_start(message: Message, db: AsyncSession):
+    """
+    Minimal user entrypoint:
+    - registers user in DB so they can receive scheduled posts
+    """
+    if not message.from_user:
+        return
+    if await upsert_user(db, telegram_id=message.from_user.id):
+        invalidate_recipients()
+
+    # Day 0 intro + level selection
+    await message.answer(_WELCOME_INTRO)
+    await asyncio.sleep(3)
+    await message.answer(_WELCOME_RULES)
     await asyncio.sleep(3)
     await message.answer("Before we start, please choose your level 👇", reply_markup=user_level_kb())
 
 
 @router.callback_query(F.data.startswith("ulevel:"))
-async def choose_level(call: CallbackQuery, session_factory):
+async def choose_level(call: CallbackQuery, db: AsyncSession):
     if not call.from_user:
         return
-    level = call.data.split(":", 1)[1]
-    if level not in LEVELS:
+    _, _, level = call.data.partition(":")
+    label = LEVELS.get(level)
+    if label is None:
         await call.answer("Неизвестный уровень", show_alert=True)
         return
 
-    db = session_factory()
-    try:
-        set_user_level(db, telegram_id=call.from_user.id, level=level)
-    finally:
-        db.close()
+    await set_user_level(db, telegram_id=call.from_user.id, level=level)
+    invalidate_recipients()
 
-    await call.message.answer(f"Great! You chose <b>{LEVELS[level]}</b>.\n\nSee you on December 29th! 🎄")
+    await call.message.answer(f"Great! You chose <b>{label}</b>.\n\nSee you on December 29th! 🎄")
     await call.answer("Сохранено ✅")
 
 
@@ -90,9 +96,6 @@ async def _deliver_post_to_chat(message: Message, post, media_items) -> None:
 
     # Media group has priority
     if media_items:
-        from aiogram.enums import ParseMode
-        from aiogram.types import InputMediaPhoto, InputMediaVideo
-
         caption = text if len(text) <= 1024 else ""
         tail_text = "" if caption else text
 
@@ -185,17 +188,14 @@ async def _deliver_post_to_chat(message: Message, post, media_items) -> None:
 
 
 @router.callback_query(F.data.startswith("openpost:"))
-async def open_post_callback(call: CallbackQuery, session_factory):
-    post_id = int(call.data.split(":", 1)[1])
-    db = session_factory()
-    try:
-        post = get_post(db, post_id)
-        media_items = get_post_media(db, post_id)
-    finally:
-        db.close()
+async def open_post_callback(call: CallbackQuery, db_read: AsyncSession):
+    _, _, post_id_raw = call.data.partition(":")
+    post_id = int(post_id_raw)
+    post = await get_post_cached(db_read, post_id)
     if not post:
         await call.answer("Пост не найден", show_alert=True)
         return
+    media_items = post.media_items
     # remove button
     try:
         await call.message.edit_reply_markup(reply_markup=None)
@@ -207,8 +207,8 @@ async def open_post_callback(call: CallbackQuery, session_factory):
 
 class NotCommand(BaseFilter):
     async def __call__(self, message: Message) -> bool:
-        txt = (message.text or message.caption or "").strip()
-        return not txt.startswith("/")
+        txt = message.text or message.caption
+        return not (txt and _COMMAND_RE.match(txt))
 
 class NotAdmin(BaseFilter):
     async def __call__(self, message: Message, settings: Settings) -> bool:
@@ -217,6 +217,12 @@ class NotAdmin(BaseFilter):
         return message.from_user.id not in settings.admin_ids
 
 
+@router.message(Command("admin"), NotAdmin())
+async def cmd_admin_denied(message: Message):
+    # the admin router itself silently drops non-admins (see AdminGuard)
+    await message.answer("Доступ запрещён.")
+
+
 @router.message(F.chat.type == "private", NotCommand(), NotAdmin())
 async def forward_non_admin_messages_to_admins(message: Message, settings: Settings):
     """
@@ -226,25 +232,29 @@ async def forward_non_admin_messages_to_admins(message: Message, settings: Setti
         return
 
     # hashtags for each forwarded message (requested format)
-    today = dt.datetime.now(ZoneInfo(settings.tz)).date().isoformat()  # YYYY-MM-DD
-    today = today.replace("-", "_")
+    today = dt.datetime.now(get_tz(settings.tz)).strftime("%Y_%m_%d")
     tags = f"#{today} #tg{message.from_user.id}"
     if message.from_user.username:
-        nick = re.sub(r"[^0-9A-Za-z_]", "_", message.from_user.username).strip("_")
+        nick = _USERNAME_UNSAFE.sub("_", message.from_user.username).strip("_")
         if nick:
             tags += f" @{nick}"
 
-    for admin_id in settings.admin_ids:
-        try:
-            forwarded = await message.bot.forward_message(
+    async def _forward_to(admin_id: int) -> None:
+        # the tag replies to the forwarded copy, so it has to wait for it
+        forwarded = await limited(
+            message.bot.forward_message(
                 chat_id=admin_id,
                 from_chat_id=message.chat.id,
                 message_id=message.message_id,
             )
-            await message.bot.send_message(
+        )
+        await limited(
+            message.bot.send_message(
                 chat_id=admin_id,
                 text=tags,
                 reply_to_message_id=forwarded.message_id,
             )
-        except Exception:
-            continue
+        )
+
+    # admins are independent of each other: fan out concurrently within the global send budget
+    await asyncio.gather(*(_forward_to(admin_id) for admin_id in settings.admin_ids), return_exceptions=True)
@@ -1,6 +1,17 @@
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
+from bot.callbacks import (
+    AdminDateCB,
+    AdminLevelCB,
+    DatesPageCB,
+    PostActCB,
+    PostListCB,
+    PostLevelCB,
+    PostOpenCB,
+)
 from bot.time_utils import format_dt
 
 LEVELS = {
@@ -14,7 +25,24 @@ POST_LEVELS = {
     "admins": "АДМИНЫ (тест)",
 }
 
+# levels a post can be assigned to from the admin keyboard ("all" = everyone)
+POST_LEVELS_SET = frozenset(POST_LEVELS) | {"all"}
+
+# Keyset cursor for post lists: "a<send_at>_<id>" (page after the row), "b<send_at>_<id>" (page before it),
+# "0" for the first page. Kept compact because callback_data is limited to 64 bytes.
+FIRST_PAGE_CURSOR = "0"
+CURSOR_TS_FORMAT = "%Y%m%d%H%M%S"
+
+
+def _post_cursor(direction: str, post) -> str:
+    return f"{direction}{post.send_at.strftime(CURSOR_TS_FORMAT)}_{post.id}"
+
+
+# Markups are immutable once built and aiogram only serializes them, so keyboards that depend
+# only on hashable arguments are built once and reused (static ones are effectively singletons).
 
+
+@lru_cache(maxsize=None)
 def admin_menu_kb() -> InlineKeyboardMarkup:
     kb = InlineKeyboardBuilder()
     kb.row(InlineKeyboardButton(text="➕ Создать пост", callback_data="admin:create"))
@@ -24,57 +52,75 @@ def admin_menu_kb() -> InlineKeyboardMarkup:
     return kb.as_markup()
 
 
+@lru_cache(maxsize=512)
 def open_post_kb(post_id: int) -> InlineKeyboardMarkup:
     kb = InlineKeyboardBuilder()
     kb.row(InlineKeyboardButton(text="Открыть", callback_data=f"openpost:{post_id}"))
     return kb.as_markup()
 
 
-def posts_list_kb(posts, tz: str, *, back_cb: str, ctx: str, ctx_value: str, page: int, has_prev: bool, has_next: bool) -> InlineKeyboardMarkup:
-    kb = InlineKeyboardBuilder()
+def posts_list_kb(
+    posts,
+    tz: str,
+    *,
+    back_cb: str,
+    ctx: str,
+    ctx_value: str,
+    page: int,
+    cursor: str,
+    has_prev: bool,
+    has_next: bool,
+) -> InlineKeyboardMarkup:
+    # rows are assembled directly: one button per row, no builder needed
+    rows = []
     for post in posts:
         title = (post.title or "").strip() or "(без названия)"
         when = format_dt(post.send_at, tz)
-        lvl = getattr(post, "level", "all")
-        label = f"#{post.id} · {when} · {lvl} · {title}"
+        label = f"#{post.id} · {when} · {post.level} · {title}"
         if len(label) > 60:
             label = label[:57] + "..."
-        kb.row(InlineKeyboardButton(text=label, callback_data=f"post:{post.id}:{ctx}:{ctx_value}:{page}"))
+        open_cb = PostOpenCB(id=post.id, ctx=ctx, ctx_value=ctx_value, page=page, cursor=cursor)
+        rows.append([InlineKeyboardButton(text=label, callback_data=open_cb.pack())])
 
-    nav = InlineKeyboardBuilder()
+    nav = []
     if has_prev:
-        nav.add(InlineKeyboardButton(text="⬅️", callback_data=f"plist:{ctx}:{ctx_value}:{page-1}"))
-    nav.add(InlineKeyboardButton(text=f"{page+1}", callback_data="noop"))
+        prev_cb = PostListCB(ctx=ctx, ctx_value=ctx_value, page=page - 1, cursor=_post_cursor("b", posts[0]))
+        nav.append(InlineKeyboardButton(text="⬅️", callback_data=prev_cb.pack()))
+    nav.append(InlineKeyboardButton(text=f"{page+1}", callback_data="noop"))
     if has_next:
-        nav.add(InlineKeyboardButton(text="➡️", callback_data=f"plist:{ctx}:{ctx_value}:{page+1}"))
-    kb.row(*nav.buttons)
+        next_cb = PostListCB(ctx=ctx, ctx_value=ctx_value, page=page + 1, cursor=_post_cursor("a", posts[-1]))
+        nav.append(InlineKeyboardButton(text="➡️", callback_data=next_cb.pack()))
+    rows.append(nav)
 
-    kb.row(InlineKeyboardButton(text="⬅️ Назад", callback_data=back_cb))
-    return kb.as_markup()
+    rows.append([InlineKeyboardButton(text="⬅️ Назад", callback_data=back_cb)])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
+@lru_cache(maxsize=512)
 def post_actions_kb(post_id: int, *, back_cb: str = "admin:back") -> InlineKeyboardMarkup:
     kb = InlineKeyboardBuilder()
-    kb.row(InlineKeyboardButton(text="✏️ Название", callback_data=f"pact:title:{post_id}"))
-    kb.row(InlineKeyboardButton(text="🎚 Уровень", callback_data=f"pact:level:{post_id}"))
-    kb.row(InlineKeyboardButton(text="📎 Контент", callback_data=f"pact:content:{post_id}"))
-    kb.row(InlineKeyboardButton(text="✏️ Текст/подпись", callback_data=f"pact:text:{post_id}"))
-    kb.row(InlineKeyboardButton(text="🔊 Аудио", callback_data=f"pact:audio:{post_id}"))
-    kb.row(InlineKeyboardButton(text="⏰ Время", callback_data=f"pact:time:{post_id}"))
-    kb.row(InlineKeyboardButton(text="🗑 Удалить", callback_data=f"pact:del:{post_id}"))
+    kb.row(InlineKeyboardButton(text="✏️ Название", callback_data=PostActCB(action="title", post_id=post_id).pack()))
+    kb.row(InlineKeyboardButton(text="🎚 Уровень", callback_data=PostActCB(action="level", post_id=post_id).pack()))
+    kb.row(InlineKeyboardButton(text="📎 Контент", callback_data=PostActCB(action="content", post_id=post_id).pack()))
+    kb.row(InlineKeyboardButton(text="✏️ Текст/подпись", callback_data=PostActCB(action="text", post_id=post_id).pack()))
+    kb.row(InlineKeyboardButton(text="🔊 Аудио", callback_data=PostActCB(action="audio", post_id=post_id).pack()))
+    kb.row(InlineKeyboardButton(text="⏰ Время", callback_data=PostActCB(action="time", post_id=post_id).pack()))
+    kb.row(InlineKeyboardButton(text="🗑 Удалить", callback_data=PostActCB(action="del", post_id=post_id).pack()))
     kb.row(InlineKeyboardButton(text="⬅️ К списку", callback_data=back_cb))
     return kb.as_markup()
 
 
+@lru_cache(maxsize=512)
 def confirm_delete_kb(post_id: int) -> InlineKeyboardMarkup:
     kb = InlineKeyboardBuilder()
     kb.row(
-        InlineKeyboardButton(text="✅ Да, удалить", callback_data=f"pact:del_yes:{post_id}"),
-        InlineKeyboardButton(text="❌ Отмена", callback_data=f"pact:del_no:{post_id}"),
+        InlineKeyboardButton(text="✅ Да, удалить", callback_data=PostActCB(action="del_yes", post_id=post_id).pack()),
+        InlineKeyboardButton(text="❌ Отмена", callback_data=PostActCB(action="del_no", post_id=post_id).pack()),
     )
     return kb.as_markup()
 
 
+@lru_cache(maxsize=None)
 def user_level_kb() -> InlineKeyboardMarkup:
     kb = InlineKeyboardBuilder()
     for key, label in LEVELS.items():
@@ -82,37 +128,40 @@ def user_level_kb() -> InlineKeyboardMarkup:
     return kb.as_markup()
 
 
+@lru_cache(maxsize=None)
 def admin_post_level_kb() -> InlineKeyboardMarkup:
     kb = InlineKeyboardBuilder()
-    kb.row(InlineKeyboardButton(text="🌍 Все уровни (all)", callback_data="plevel:all"))
+    kb.row(InlineKeyboardButton(text="🌍 Все уровни (all)", callback_data=PostLevelCB(level="all").pack()))
     for key, label in POST_LEVELS.items():
-        kb.row(InlineKeyboardButton(text=label, callback_data=f"plevel:{key}"))
+        kb.row(InlineKeyboardButton(text=label, callback_data=PostLevelCB(level=key).pack()))
     kb.row(InlineKeyboardButton(text="⬅️ Назад", callback_data="admin:back"))
     return kb.as_markup()
 
 
-def dates_kb(dates: list[str], *, page: int, has_prev: bool, has_next: bool) -> InlineKeyboardMarkup:
+@lru_cache(maxsize=512)
+def dates_kb(dates: tuple[str, ...], *, page: int, has_prev: bool, has_next: bool) -> InlineKeyboardMarkup:
     kb = InlineKeyboardBuilder()
     for d in dates:
-        kb.row(InlineKeyboardButton(text=d, callback_data=f"adate:{d}"))
+        kb.row(InlineKeyboardButton(text=d, callback_data=AdminDateCB(date=d).pack()))
 
     nav = InlineKeyboardBuilder()
     if has_prev:
-        nav.add(InlineKeyboardButton(text="⬅️", callback_data=f"dpage:{page-1}"))
+        nav.add(InlineKeyboardButton(text="⬅️", callback_data=DatesPageCB(page=page - 1).pack()))
     nav.add(InlineKeyboardButton(text=f"{page+1}", callback_data="noop"))
     if has_next:
-        nav.add(InlineKeyboardButton(text="➡️", callback_data=f"dpage:{page+1}"))
+        nav.add(InlineKeyboardButton(text="➡️", callback_data=DatesPageCB(page=page + 1).pack()))
     kb.row(*nav.buttons)
 
     kb.row(InlineKeyboardButton(text="⬅️ Назад", callback_data="admin:back"))
     return kb.as_markup()
 
 
+@lru_cache(maxsize=None)
 def levels_kb() -> InlineKeyboardMarkup:
     kb = InlineKeyboardBuilder()
-    kb.row(InlineKeyboardButton(text="🌍 Все (all)", callback_data="alevel:all"))
+    kb.row(InlineKeyboardButton(text="🌍 Все (all)", callback_data=AdminLevelCB(level="all").pack()))
     for key, label in POST_LEVELS.items():
-        kb.row(InlineKeyboardButton(text=label, callback_data=f"alevel:{key}"))
+        kb.row(InlineKeyboardButton(text=label, callback_data=AdminLevelCB(level=key).pack()))
     kb.row(InlineKeyboardButton(text="⬅️ Назад", callback_data="admin:back"))
     return kb.as_markup()
 
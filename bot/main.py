@@ -6,36 +6,55 @@ from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 
 from bot.admin_handlers import admin_router
+from bot.api_session import FastJsonSession
 from bot.config import load_settings
 from bot.db import init_db, make_engine, make_session_factory
 from bot.handlers import router
-from bot.scheduler import setup_scheduler
+from bot.middlewares import DBSessionMiddleware, ReleaseReadSession
+from bot.scheduler import setup_scheduler, wait_for_sends
 from bot.seed_posts import seed_posts_from_json
 
 
 async def main() -> None:
     logging.basicConfig(level=logging.INFO)
 
+    # Python 3.12+: tasks start running inline in create_task(), short ones finish without a loop hop
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     settings = load_settings()
-    engine = make_engine(settings.database_url)
+    engine = make_engine(
+        settings.database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
     session_factory = make_session_factory(engine)
-    init_db(engine)
+    await init_db(engine)
 
-    bot = Bot(token=settings.bot_token, default=DefaultBotProperties(parse_mode=ParseMode.HTML))
+    bot = Bot(
+        token=settings.bot_token,
+        session=FastJsonSession(),
+        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+    )
+    bot.session.middleware(ReleaseReadSession())
     # used by scheduler for delivery notifications
-    bot._admin_ids = settings.admin_ids  # type: ignore[attr-defined]
+    bot._admin_ids = tuple(sorted(settings.admin_ids))  # type: ignore[attr-defined]
     dp = Dispatcher()
 
     # dependency injection (available as handler args by name)
     dp["settings"] = settings
     dp["session_factory"] = session_factory
+    # one DB session per update, injected as `db`
+    dp.update.outer_middleware(DBSessionMiddleware(session_factory))
 
     dp.include_router(router)
     dp.include_router(admin_router)
 
     if settings.seed_on_start:
         try:
-            created = seed_posts_from_json(session_factory=session_factory, json_path=settings.seed_json_path, tz=settings.tz)
+            created = await seed_posts_from_json(session_factory=session_factory, json_path=settings.seed_json_path, tz=settings.tz)
             if created:
                 logging.getLogger(__name__).info("Seeded %s posts from %s", created, settings.seed_json_path)
         except FileNotFoundError:
@@ -43,17 +62,33 @@ async def main() -> None:
         except Exception:
             logging.getLogger(__name__).exception("Failed to seed posts from %s", settings.seed_json_path)
 
-    scheduler = setup_scheduler(bot=bot, session_factory=session_factory, tz=settings.tz)
+    scheduler = await setup_scheduler(
+        bot=bot,
+        session_factory=session_factory,
+        tz=settings.tz,
+    )
     dp["scheduler"] = scheduler
 
     try:
         await dp.start_polling(bot)
     finally:
-        await bot.session.close()
+        # no new jobs; let running broadcasts finish before the bot session and engine go away
         scheduler.shutdown(wait=False)
+        await wait_for_sends()
+        await bot.session.close()
+        await engine.dispose()
 
 
-if __name__ == "__main__":
-    asyncio.run(main())
+def _loop_factory():
+    # uvloop is faster than the default asyncio loop; it isn't available on Windows, so fall back there
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
 
 
+if __name__ == "__main__":
+    # asyncio.Runner rather than asyncio.run(..., loop_factory=...): the latter needs Python 3.12 (the image is 3.11)
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        runner.run(main())
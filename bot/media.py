@@ -0,0 +1,36 @@
+from aiogram.enums import ParseMode
+from aiogram.types import InputMediaPhoto, InputMediaVideo
+
+# Telegram caption limit; longer text is sent as a separate message
+CAPTION_LIMIT = 1024
+
+# media types that can go into send_media_group
+_ALBUM_MEDIA = {"photo": InputMediaPhoto, "video": InputMediaVideo}
+
+
+def split_caption(text: str) -> tuple[str, str]:
+    """
+    -> (caption, tail_text): the text fits as a caption, or goes out after the media.
+    """
+    caption = text if len(text) <= CAPTION_LIMIT else ""
+    return caption, ("" if caption else text)
+
+
+def build_album(media_items, caption: str) -> list[InputMediaPhoto | InputMediaVideo] | None:
+    """
+    InputMedia list for send_media_group() if every item is a photo/video, else None.
+    The (HTML) caption goes on the first item only.
+    """
+    classes = [_ALBUM_MEDIA.get((item.media_type or "").strip().lower()) for item in media_items]
+    if not classes or None in classes:
+        return None
+    first_cls, first = classes[0], media_items[0]
+    album = [
+        first_cls(
+            media=first.file_id,
+            caption=caption or None,
+            parse_mode=ParseMode.HTML if caption else None,
+        )
+    ]
+    album.extend(cls(media=item.file_id) for cls, item in zip(classes[1:], media_items[1:]))
+    return album
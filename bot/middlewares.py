@@ -0,0 +1,84 @@
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable
+
+from aiogram import BaseMiddleware, Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiogram.types import CallbackQuery, TelegramObject, User
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# the current update's `db_read` session, released by ReleaseReadSession before each Bot API call.
+# A one-slot list: tasks spawned by a handler inherit the context, and the slot is emptied once the
+# update is done so they stop touching the finished session.
+_read_session: ContextVar[list[AsyncSession | None]] = ContextVar("_read_session")
+
+
+class DBSessionMiddleware(BaseMiddleware):
+    """
+    Opens one AsyncSession per update and passes it to handlers as `db`.
+    The session checks out a pool connection only on first use, so updates
+    that never touch the DB don't pay for it. Writes commit (which returns the
+    connection). Read-only handlers take `db_read` instead: a second lazy
+    session that ReleaseReadSession closes before every Bot API call, so
+    Telegram I/O never runs with a connection checked out.
+    """
+
+    def __init__(self, session_factory) -> None:
+        self.session_factory = session_factory
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        async with self.session_factory() as session, self.session_factory() as read_session:
+            data["db"] = session
+            data["db_read"] = read_session
+            slot: list[AsyncSession | None] = [read_session]
+            token = _read_session.set(slot)
+            try:
+                return await handler(event, data)
+            finally:
+                slot[0] = None
+                _read_session.reset(token)
+
+
+class ReleaseReadSession(BaseRequestMiddleware):
+    """
+    Bot request middleware: returns the `db_read` connection to the pool before the request goes out.
+    Loaded objects stay usable (expire_on_commit=False); a later read simply checks out a connection again.
+    """
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        slot = _read_session.get(None)
+        if slot and slot[0] is not None:
+            await slot[0].close()
+        return await make_request(bot, method)
+
+
+class AdminGuard(BaseMiddleware):
+    """
+    Lets only settings.admin_ids through to the router it is attached to.
+    Registered as an outer middleware, so foreign updates are dropped before
+    any filter or FSM lookup runs.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        user: User | None = data.get("event_from_user")
+        if user is None or user.id not in data["settings"].admin_ids:
+            if isinstance(event, CallbackQuery):
+                await event.answer("Нет доступа", show_alert=True)
+            return None
+        return await handler(event, data)
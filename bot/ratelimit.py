@@ -0,0 +1,62 @@
+import asyncio
+from collections import deque
+
+from aiolimiter import AsyncLimiter
+
+# Telegram allows a bot roughly 30 outgoing messages per second overall.
+TELEGRAM_LIMITER = AsyncLimiter(30, 1)
+
+# loop time until which all sends hold off after a flood wait (see penalize)
+_paused_until = 0.0
+
+# ...and about 20 messages per minute into one group or channel (negative chat ids); private
+# chats have no such window, so sends to users are bounded by the global budget only.
+PER_CHAT_LIMIT = 20
+PER_CHAT_WINDOW = 60.0
+# chat_id -> loop times of recent sends (sliding window); stale chats are pruned past this size
+_PER_CHAT_PRUNE_AT = 4096
+_chat_sends: dict[int, deque[float]] = {}
+
+
+def _prune_chat_sends(now: float) -> None:
+    stale = [chat_id for chat_id, sends in _chat_sends.items() if not sends or now - sends[-1] >= PER_CHAT_WINDOW]
+    for chat_id in stale:
+        del _chat_sends[chat_id]
+
+
+async def _chat_slot(chat_id: int) -> None:
+    loop = asyncio.get_running_loop()
+    sends = _chat_sends.get(chat_id)
+    if sends is None:
+        if len(_chat_sends) >= _PER_CHAT_PRUNE_AT:
+            _prune_chat_sends(loop.time())
+        sends = _chat_sends[chat_id] = deque()
+    while True:
+        now = loop.time()
+        while sends and now - sends[0] >= PER_CHAT_WINDOW:
+            sends.popleft()
+        if len(sends) < PER_CHAT_LIMIT:
+            break
+        await asyncio.sleep(PER_CHAT_WINDOW - (now - sends[0]) + 0.05)
+    sends.append(now)
+
+
+def penalize(retry_after: float) -> None:
+    """
+    Telegram answered 429 (RetryAfter): stop every limited() sender for that long, not just the one that hit it.
+    """
+    global _paused_until
+    _paused_until = max(_paused_until, asyncio.get_running_loop().time() + retry_after)
+
+
+async def limited(coro, chat_id: int | None = None):
+    """
+    Await a Bot API call once the global send budget (and a group chat's, if given) allows it.
+    """
+    if chat_id is not None and chat_id < 0:
+        await _chat_slot(chat_id)
+    loop = asyncio.get_running_loop()
+    while (delay := _paused_until - loop.time()) > 0:
+        await asyncio.sleep(delay)
+    async with TELEGRAM_LIMITER:
+        return await coro
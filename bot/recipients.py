@@ -0,0 +1,30 @@
+import time
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from bot.db import Level, iter_user_ids
+
+# Several posts often fire together (e.g. due posts at startup) and each needs the same
+# recipient list: keep a short-lived snapshot of telegram ids per level (None = all users).
+RECIPIENTS_TTL = 30.0
+_cache: dict[Optional[Level], tuple[float, tuple[int, ...]]] = {}
+
+
+async def recipients_for(db: AsyncSession, level: Optional[Level], ttl: float = RECIPIENTS_TTL) -> tuple[int, ...]:
+    """
+    Telegram ids of users of `level` (all users for None), cached for `ttl` seconds.
+    """
+    cached = _cache.get(level)
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    ids = tuple([tid async for tid in iter_user_ids(db, level)])
+    _cache[level] = (time.monotonic(), ids)
+    return ids
+
+
+def invalidate_recipients() -> None:
+    """
+    Drop all snapshots; call after users are added or change level.
+    """
+    _cache.clear()
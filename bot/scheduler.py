@@ -1,91 +1,299 @@
 import asyncio
 import datetime as dt
 import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
 
 from aiogram import Bot
 from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError, TelegramRetryAfter
 from aiogram.enums import ParseMode
-from aiogram.types import InputMediaPhoto, InputMediaVideo
+from aiogram.types import InlineKeyboardMarkup, InputMediaPhoto, InputMediaVideo
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.date import DateTrigger
-from sqlalchemy.orm import Session
 
+from bot.api_session import FastJsonSession
 from bot.db import (
-    get_broadcast_settings,
+    BroadcastSettings,
+    get_broadcast_settings_cached,
     Post,
-    get_all_users,
-    get_post,
-    get_post_media,
+    get_post_with_media,
     get_unsent_due_posts,
     get_unsent_future_posts,
-    get_users_by_level,
     mark_post_sent,
+    record_deliveries,
 )
 from bot.keyboards import open_post_kb
+from bot.media import build_album, split_caption
+from bot.ratelimit import limited, penalize
+from bot.recipients import recipients_for
 
 logger = logging.getLogger(__name__)
 
 
+# broadcast workers (recipients served at once); the global limiter in bot.ratelimit keeps the overall rate
+BROADCAST_CONCURRENCY = 25
+# flood-wait retries per Bot API call before giving up on the recipient
+RETRY_AFTER_ATTEMPTS = 3
+
+
 def _job_id(post_id: int) -> str:
     return f"post_{post_id}"
 
 
-async def _send_post(bot: Bot, session_factory, post_id: int, tz: str) -> None:
-    db: Session = session_factory()
+# the event loop keeps only weak references to tasks: hold in-flight sends until they finish
+# (and so shutdown can wait for them, see wait_for_sends)
+_send_tasks: set[asyncio.Task] = set()
+# on shutdown, how long in-flight broadcasts may keep running before they're cancelled
+SHUTDOWN_SEND_TIMEOUT = 30
+
+
+# broadcasts running at once: after downtime many posts can be due together, and they all share
+# Telegram's global rate limit; the rest wait their turn (in order)
+MAX_PARALLEL_BROADCASTS = 2
+_broadcast_sem = asyncio.Semaphore(MAX_PARALLEL_BROADCASTS)
+
+
+async def _send_post_guarded(bot: Bot, session_factory, post_id: int, tz: str) -> None:
+    # a failed broadcast is logged here and never cancels its siblings in a TaskGroup
     try:
-        post = get_post(db, post_id)
+        async with _broadcast_sem:
+            await _send_post(bot, session_factory, post_id, tz)
+    except Exception:
+        logger.exception("Broadcast of post_id=%s failed", post_id)
+
+
+def _track(task: asyncio.Task) -> None:
+    _send_tasks.add(task)
+    task.add_done_callback(_send_tasks.discard)
+
+
+def _send_in_background(bot: Bot, session_factory, post_id: int, tz: str) -> None:
+    _track(asyncio.create_task(_send_post_guarded(bot, session_factory, post_id, tz)))
+
+
+async def _send_due_posts(bot: Bot, session_factory, post_ids: list[int], tz: str) -> None:
+    # catch-up after downtime: one task per post, finished together
+    async with asyncio.TaskGroup() as tg:
+        for post_id in post_ids:
+            tg.create_task(_send_post_guarded(bot, session_factory, post_id, tz))
+    logger.info("Catch-up sent %s due posts", len(post_ids))
+
+
+async def wait_for_sends(timeout: float = SHUTDOWN_SEND_TIMEOUT) -> None:
+    """
+    Let in-flight broadcasts finish (up to `timeout` seconds), then cancel the rest.
+    Call after the scheduler is shut down, before closing the bot session.
+    """
+    if not _send_tasks:
+        return
+    _done, pending = await asyncio.wait(set(_send_tasks), timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.warning("Cancelled %s unfinished broadcasts on shutdown", len(pending))
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _send_post(bot: Bot, session_factory, post_id: int, tz: str) -> None:
+    # everything the broadcast needs is read up front and the session is released before the
+    # (possibly minutes long) Telegram I/O, so a broadcast doesn't pin a pooled connection
+    async with session_factory() as db:
+        post = await get_post_with_media(db, post_id)
         if not post:
             return
         if post.sent:
             return
 
-        media_items = get_post_media(db, post_id)
+        pv = PostView.of(post)
+        media_items = post.media_items
 
         # recipients
-        admin_ids = [int(x) for x in (getattr(bot, "_admin_ids", []) or [])]
-        if post.level == "admins":
+        admin_ids: tuple[int, ...] = bot._admin_ids
+        if pv.level == "admins":
             chat_ids = admin_ids
-        elif post.level == "all":
-            users = get_all_users(db)
-            chat_ids = [u.telegram_id for u in users] + admin_ids
         else:
-            users = get_users_by_level(db, post.level)
-            chat_ids = [u.telegram_id for u in users] + admin_ids
-
-        # uniq
-        chat_ids = list(dict.fromkeys(chat_ids))
-
-        total_count = len(chat_ids)
-        sent_count = 0
-        teaser = get_broadcast_settings(db)
-        for chat_id in chat_ids:
-            try:
-                if teaser.teaser_text.strip() or teaser.teaser_file_id:
-                    await _deliver_teaser_to_user(bot, chat_id, teaser, post_id=post.id)
-                else:
-                    await _deliver_post_to_user(bot, chat_id, post, media_items)
-                sent_count += 1
-                await asyncio.sleep(0.04)
-            except TelegramRetryAfter as e:
-                await asyncio.sleep(float(e.retry_after) + 0.5)
-            except TelegramForbiddenError:
-                # user blocked bot / can't be reached: ignore
-                continue
-            except TelegramBadRequest:
-                continue
-            except Exception:
-                logger.exception("Failed sending post_id=%s to telegram_id=%s", post_id, chat_id)
-                continue
+            # ids only; collected up front so the read doesn't stay open for the whole broadcast
+            level = None if pv.level == "all" else pv.level
+            chat_ids = await recipients_for(db, level)  # unique already (telegram_id is unique)
+            if admin_ids:
+                # admins get every post too; skip those who are also registered users
+                user_ids = set(chat_ids)
+                chat_ids += tuple(a for a in admin_ids if a not in user_ids)
+
+        if not chat_ids:
+            # nobody to send to (empty level, no admins): just close the post
+            await mark_post_sent(db, post_id, sent_at=dt.datetime.now(), delivered=0, total=0)
+            logger.info("Post %s has no recipients", post_id)
+            return
+
+        teaser = TeaserView.of(await get_broadcast_settings_cached(db))
+        # per-post payload, built once for all recipients
+        plan = build_media_plan(pv, media_items)
+
+    total_count = len(chat_ids)
+    use_teaser = bool(teaser.text.strip() or teaser.file_id)
+    teaser_kb = open_post_kb(pv.id)
+    if use_teaser and isinstance(bot.session, FastJsonSession):
+        # one JSON encoding of the "Open" button for the whole audience
+        bot.session.preencode_markup(bot, teaser_kb)
+
+    # failures are only counted here and logged once after the broadcast: a burst of errors
+    # doesn't format thousands of tracebacks in the send loop
+    unreachable = 0
+    failed = 0
+    errors_sample: deque[tuple[int, Exception]] = deque(maxlen=5)
+
+    async def _deliver_one(chat_id: int) -> bool:
+        nonlocal unreachable, failed
+        try:
+            # each Bot API call takes its own limiter slot and retries its own flood waits (_send_step),
+            # so a retry never re-sends the parts of a post that already went out
+            if use_teaser:
+                await _deliver_teaser_to_user(bot, chat_id, teaser, kb=teaser_kb)
+            else:
+                await _deliver_post_to_user(bot, chat_id, plan)
+            return True
+        except (TelegramForbiddenError, TelegramBadRequest):
+            # user blocked bot / can't be reached: ignore
+            unreachable += 1
+            return False
+        except Exception as e:
+            # includes a flood wait that outlasted RETRY_AFTER_ATTEMPTS
+            failed += 1
+            errors_sample.append((chat_id, e))
+            return False
+
+    # fixed pool of workers pulling from one shared iterator: memory doesn't grow with the
+    # audience (no coroutine per recipient), and next() never interleaves within one loop
+    pending = iter(chat_ids)
+    # (chat_id, delivered) per recipient, stored in bulk at the end
+    results: list[tuple[int, bool]] = []
+
+    async def _worker() -> int:
+        delivered = 0
+        for chat_id in pending:
+            ok = await _deliver_one(chat_id)
+            results.append((chat_id, ok))
+            delivered += ok
+        return delivered
+
+    workers = min(BROADCAST_CONCURRENCY, total_count)
+    sent_count = sum(await asyncio.gather(*(_worker() for _ in range(workers))))
+
+    now = dt.datetime.now()
+    async with session_factory() as db:
+        await record_deliveries(db, post_id, results)
+        await mark_post_sent(db, post_id, sent_at=now, delivered=sent_count, total=total_count)
+    logger.info("Post %s sent to %s users", post_id, sent_count)
+    if unreachable or failed:
+        logger.warning("Post %s: %s recipients unreachable, %s failed", post_id, unreachable, failed)
+    for chat_id, exc in errors_sample:
+        logger.warning("Failed sending post_id=%s to telegram_id=%s", post_id, chat_id, exc_info=exc)
+    await _notify_admins_summary(bot, post_id=pv.id, post_level=pv.level, delivered=sent_count, total=total_count)
+
+
+# media_type -> (Bot method, name of its file parameter) for media that takes a caption;
+# video notes can't carry one and are handled separately
+_CAPTIONED_SENDERS = {
+    "photo": (Bot.send_photo, "photo"),
+    "video": (Bot.send_video, "video"),
+    "document": (Bot.send_document, "document"),
+    "audio": (Bot.send_audio, "audio"),
+    "voice": (Bot.send_voice, "voice"),
+}
+
+
+def _send_captioned(bot: Bot, chat_id: int, media_type: str, file_id: str, **kwargs):
+    method, file_param = _CAPTIONED_SENDERS[media_type]
+    return method(bot, chat_id=chat_id, **{file_param: file_id}, **kwargs)
+
+
+async def _send_step(chat_id: int, make_call: Callable[[], Awaitable]) -> None:
+    """
+    One Bot API call of a delivery: takes its own rate-limit slot, and a flood wait retries just this call.
+    """
+    for attempt in range(RETRY_AFTER_ATTEMPTS):
+        try:
+            await limited(make_call(), chat_id)
+            return
+        except TelegramRetryAfter as e:
+            # the whole pool backs off (penalize), then this call is retried
+            penalize(float(e.retry_after) + 0.5)
+            if attempt == RETRY_AFTER_ATTEMPTS - 1:
+                raise
+
+
+@dataclass(slots=True)
+class PostView:
+    """
+    Plain snapshot of the post fields a broadcast reads: no ORM instrumentation in the send loop.
+    """
+
+    id: int
+    level: str
+    text: str
+    media_type: str
+    file_id: str | None
+
+    @classmethod
+    def of(cls, post: Post) -> "PostView":
+        return cls(post.id, post.level, post.text or "", (post.media_type or "").strip().lower(), post.file_id)
 
-        now = dt.datetime.now()
-        mark_post_sent(db, post_id, sent_at=now)
-        logger.info("Post %s sent to %s users", post_id, sent_count)
-        await _notify_admins_summary(bot, post_id=post.id, post_level=post.level, delivered=sent_count, total=total_count)
-    finally:
-        db.close()
 
+@dataclass(slots=True)
+class TeaserView:
+    """
+    Plain snapshot of the teaser (BroadcastSettings), so it outlives the session.
+    """
+
+    text: str
+    media_type: str
+    file_id: str | None
 
-async def _deliver_post_to_user(bot: Bot, chat_id: int, post: Post, media_items) -> None:
+    @classmethod
+    def of(cls, settings: BroadcastSettings) -> "TeaserView":
+        return cls(
+            settings.teaser_text or "", (settings.teaser_media_type or "").strip().lower(), settings.teaser_file_id
+        )
+
+
+@dataclass(slots=True)
+class MediaPlan:
+    """
+    What to send for a post, normalized once per broadcast (the post is the same for every recipient).
+    """
+
+    media_type: str
+    file_id: str | None
+    text: str
+    caption: str
+    tail_text: str
+    # stored media group as (media_type, file_id); empty for single-file/text posts
+    items: tuple[tuple[str, str], ...]
+    album: list[InputMediaPhoto | InputMediaVideo] | None
+
+
+def build_media_plan(pv: PostView, media_items) -> MediaPlan:
+    text = pv.text
+    caption, tail_text = split_caption(text)
+    items = tuple(
+        ((item.media_type or "").strip().lower(), item.file_id) for item in media_items if item.file_id
+    )
+    return MediaPlan(
+        media_type=pv.media_type,
+        file_id=pv.file_id,
+        text=text,
+        caption=caption,
+        # Telegram caption limit is 1024 chars: the rest goes as a separate message
+        tail_text=tail_text if tail_text.strip() else "",
+        items=items,
+        album=build_album(media_items, caption) if media_items else None,
+    )
+
+
+async def _deliver_post_to_user(bot: Bot, chat_id: int, plan: MediaPlan) -> None:
     """
     Send a post with optional media (stored as Telegram file_id).
     Supported:
@@ -93,52 +301,19 @@ async def _deliver_post_to_user(bot: Bot, chat_id: int, post: Post, media_items)
     - single: photo/video/document/audio/voice/video_note
     Otherwise fall back to text.
     """
-    media_type = (post.media_type or "").strip().lower()
-    file_id = post.file_id
-    text = post.text or ""
-
     # Media group (album) has priority over single file_id
-    if media_items:
-        # Telegram caption limit is 1024 chars. If longer, send text separately.
-        caption = text if len(text) <= 1024 else ""
-        tail_text = "" if caption else text
-
-        types = [(getattr(item, "media_type", "") or "").strip().lower() for item in media_items]
-
-        # If all are photo/video -> send as album
-        if types and all(t in ("photo", "video") for t in types):
-            album = []
-            for idx, item in enumerate(media_items):
-                itype = (getattr(item, "media_type", "") or "").strip().lower()
-                if itype == "photo":
-                    album.append(
-                        InputMediaPhoto(
-                            media=item.file_id,
-                            caption=caption if idx == 0 else None,
-                            parse_mode=ParseMode.HTML if idx == 0 and caption else None,
-                        )
-                    )
-                elif itype == "video":
-                    album.append(
-                        InputMediaVideo(
-                            media=item.file_id,
-                            caption=caption if idx == 0 else None,
-                            parse_mode=ParseMode.HTML if idx == 0 and caption else None,
-                        )
-                    )
-            if album:
-                await bot.send_media_group(chat_id=chat_id, media=album)
-                if tail_text.strip():
-                    await bot.send_message(chat_id=chat_id, text=tail_text, parse_mode=ParseMode.HTML)
-                return
+    if plan.items:
+        # All photo/video -> album
+        if plan.album:
+            await _send_step(chat_id, partial(bot.send_media_group, chat_id=chat_id, media=plan.album))
+            if plan.tail_text:
+                await _send_step(chat_id, partial(bot.send_message, chat_id=chat_id, text=plan.tail_text, parse_mode=ParseMode.HTML))
+            return
 
         # Otherwise (audio/document/etc) send sequentially; only first gets caption (if short enough)
+        caption = plan.caption
         first_caption_sent = False
-        for item in media_items:
-            itype = (getattr(item, "media_type", "") or "").strip().lower()
-            fid = getattr(item, "file_id", None)
-            if not fid:
-                continue
+        for itype, fid in plan.items:
             cap = None
             pm = None
             if not first_caption_sent and caption:
@@ -146,117 +321,97 @@ async def _deliver_post_to_user(bot: Bot, chat_id: int, post: Post, media_items)
                 pm = ParseMode.HTML
                 first_caption_sent = True
 
-            if itype == "audio":
-                await bot.send_audio(chat_id=chat_id, audio=fid, caption=cap, parse_mode=pm)
-            elif itype == "document":
-                await bot.send_document(chat_id=chat_id, document=fid, caption=cap, parse_mode=pm)
-            elif itype == "voice":
-                await bot.send_voice(chat_id=chat_id, voice=fid, caption=cap, parse_mode=pm)
-            elif itype == "video_note":
-                await bot.send_video_note(chat_id=chat_id, video_note=fid)
+            if itype == "video_note":
+                await _send_step(chat_id, partial(bot.send_video_note, chat_id=chat_id, video_note=fid))
                 if cap:
-                    await bot.send_message(chat_id=chat_id, text=cap, parse_mode=ParseMode.HTML)
-            elif itype == "photo":
-                await bot.send_photo(chat_id=chat_id, photo=fid, caption=cap, parse_mode=pm)
-            elif itype == "video":
-                await bot.send_video(chat_id=chat_id, video=fid, caption=cap, parse_mode=pm)
+                    await _send_step(chat_id, partial(bot.send_message, chat_id=chat_id, text=cap, parse_mode=ParseMode.HTML))
+            elif itype in _CAPTIONED_SENDERS:
+                await _send_step(chat_id, partial(_send_captioned, bot, chat_id, itype, fid, caption=cap, parse_mode=pm))
             else:
                 # unknown -> fallback as message
-                await bot.send_message(chat_id=chat_id, text=cap or "", parse_mode=ParseMode.HTML if cap else None)
+                await _send_step(chat_id, partial(bot.send_message, chat_id=chat_id, text=cap or "", parse_mode=ParseMode.HTML if cap else None))
 
-        if tail_text.strip():
-            await bot.send_message(chat_id=chat_id, text=tail_text, parse_mode=ParseMode.HTML)
+        if plan.tail_text:
+            await _send_step(chat_id, partial(bot.send_message, chat_id=chat_id, text=plan.tail_text, parse_mode=ParseMode.HTML))
         return
 
+    media_type = plan.media_type
+    file_id = plan.file_id
+    text = plan.text
     if not media_type or not file_id:
-        await bot.send_message(chat_id=chat_id, text=text, parse_mode=ParseMode.HTML)
+        await _send_step(chat_id, partial(bot.send_message, chat_id=chat_id, text=text, parse_mode=ParseMode.HTML))
         return
 
-    if media_type == "photo":
-        await bot.send_photo(chat_id=chat_id, photo=file_id, caption=text, parse_mode=ParseMode.HTML)
-        return
-    if media_type == "video":
-        await bot.send_video(chat_id=chat_id, video=file_id, caption=text, parse_mode=ParseMode.HTML)
-        return
-    if media_type == "document":
-        await bot.send_document(chat_id=chat_id, document=file_id, caption=text, parse_mode=ParseMode.HTML)
-        return
-    if media_type == "audio":
-        await bot.send_audio(chat_id=chat_id, audio=file_id, caption=text, parse_mode=ParseMode.HTML)
-        return
-    if media_type == "voice":
-        await bot.send_voice(chat_id=chat_id, voice=file_id, caption=text, parse_mode=ParseMode.HTML)
+    if media_type in _CAPTIONED_SENDERS:
+        await _send_step(chat_id, partial(_send_captioned, bot, chat_id, media_type, file_id, caption=text, parse_mode=ParseMode.HTML))
         return
     if media_type == "video_note":
-        await bot.send_video_note(chat_id=chat_id, video_note=file_id)
+        await _send_step(chat_id, partial(bot.send_video_note, chat_id=chat_id, video_note=file_id))
         if text.strip():
-            await bot.send_message(chat_id=chat_id, text=text, parse_mode=ParseMode.HTML)
+            await _send_step(chat_id, partial(bot.send_message, chat_id=chat_id, text=text, parse_mode=ParseMode.HTML))
         return
 
-    await bot.send_message(chat_id=chat_id, text=text, parse_mode=ParseMode.HTML)
+    await _send_step(chat_id, partial(bot.send_message, chat_id=chat_id, text=text, parse_mode=ParseMode.HTML))
 
 
-async def _deliver_teaser_to_user(bot: Bot, chat_id: int, teaser, *, post_id: int) -> None:
+async def _deliver_teaser_to_user(bot: Bot, chat_id: int, teaser: TeaserView, *, kb: InlineKeyboardMarkup) -> None:
     """
-    Send teaser content with "Open" button. Teaser is stored in BroadcastSettings.
+    Send teaser content with "Open" button (kb). Teaser is stored in BroadcastSettings.
     """
-    media_type = (teaser.teaser_media_type or "").strip().lower()
-    file_id = teaser.teaser_file_id
-    text = teaser.teaser_text or ""
-    kb = open_post_kb(post_id)
+    media_type = teaser.media_type
+    file_id = teaser.file_id
+    text = teaser.text
 
     if not media_type or not file_id:
-        await bot.send_message(chat_id=chat_id, text=text, reply_markup=kb)
+        await _send_step(chat_id, partial(bot.send_message, chat_id=chat_id, text=text, reply_markup=kb))
         return
 
-    if media_type == "photo":
-        await bot.send_photo(chat_id=chat_id, photo=file_id, caption=text, reply_markup=kb)
-        return
-    if media_type == "video":
-        await bot.send_video(chat_id=chat_id, video=file_id, caption=text, reply_markup=kb)
-        return
-    if media_type == "document":
-        await bot.send_document(chat_id=chat_id, document=file_id, caption=text, reply_markup=kb)
-        return
-    if media_type == "audio":
-        await bot.send_audio(chat_id=chat_id, audio=file_id, caption=text, reply_markup=kb)
-        return
-    if media_type == "voice":
-        await bot.send_voice(chat_id=chat_id, voice=file_id, caption=text, reply_markup=kb)
+    if media_type in _CAPTIONED_SENDERS:
+        await _send_step(chat_id, partial(_send_captioned, bot, chat_id, media_type, file_id, caption=text, reply_markup=kb))
         return
     if media_type == "video_note":
-        await bot.send_video_note(chat_id=chat_id, video_note=file_id)
-        await bot.send_message(chat_id=chat_id, text=text, reply_markup=kb)
+        await _send_step(chat_id, partial(bot.send_video_note, chat_id=chat_id, video_note=file_id))
+        await _send_step(chat_id, partial(bot.send_message, chat_id=chat_id, text=text, reply_markup=kb))
         return
 
-    await bot.send_message(chat_id=chat_id, text=text, reply_markup=kb)
+    await _send_step(chat_id, partial(bot.send_message, chat_id=chat_id, text=text, reply_markup=kb))
+
+
+_SUMMARY_TEMPLATE = (
+    "✅ Рассылка завершена\n"
+    "Пост: <b>#{id}</b> (уровень: <b>{lvl}</b>)\n"
+    "Доставлено: <b>{d}</b> / <b>{t}</b>"
+)
+
 
 async def _notify_admins_summary(bot: Bot, *, post_id: int, post_level: str, delivered: int, total: int) -> None:
     """
     Sends ONE admin notification per post send.
-    Admin IDs are stored on the Bot instance as `bot._admin_ids` (set in main).
+    Admin IDs are stored on the Bot instance as `bot._admin_ids` (a tuple of ints, set in main).
     """
-    admin_ids = getattr(bot, "_admin_ids", None)
+    admin_ids = bot._admin_ids
     if not admin_ids:
         return
-    text = (
-        f"✅ Рассылка завершена\n"
-        f"Пост: <b>#{post_id}</b> (уровень: <b>{post_level}</b>)\n"
-        f"Доставлено: <b>{delivered}</b> / <b>{total}</b>"
-    )
-    for admin_id in list(admin_ids):
+    text = _SUMMARY_TEMPLATE.format(id=post_id, lvl=post_level, d=delivered, t=total)
+    # best effort: a failed admin (blocked bot etc.) doesn't affect the others
+    await asyncio.gather(*(_send_admin(bot, admin_id, text) for admin_id in admin_ids), return_exceptions=True)
+
+
+async def _send_admin(bot: Bot, admin_id: int, text: str, max_retries: int = 2) -> None:
+    # one call site; flood waits pause the shared limiter (like broadcasts) and are retried
+    for _attempt in range(max_retries + 1):
         try:
-            await bot.send_message(chat_id=int(admin_id), text=text, disable_web_page_preview=True)
+            await limited(bot.send_message(chat_id=admin_id, text=text, disable_web_page_preview=True), admin_id)
+            return
         except TelegramRetryAfter as e:
-            await asyncio.sleep(float(e.retry_after) + 0.5)
-            try:
-                await bot.send_message(chat_id=int(admin_id), text=text, disable_web_page_preview=True)
-            except Exception:
-                continue
+            penalize(float(e.retry_after) + 0.5)
         except (TelegramForbiddenError, TelegramBadRequest):
-            continue
+            # admin blocked the bot / never started it
+            return
         except Exception:
-            continue
+            # network errors etc.: this admin misses the summary, the others still get it
+            logger.exception("Failed sending broadcast summary to admin_id=%s", admin_id)
+            return
 
 
 def schedule_or_send_now(
@@ -266,11 +421,13 @@ def schedule_or_send_now(
     session_factory,
     post: Post,
     tz: str,
+    now: dt.datetime | None = None,
 ) -> None:
     if post.sent:
         return
 
-    now = dt.datetime.now()
+    if now is None:
+        now = dt.datetime.now()
     jobid = _job_id(post.id)
 
     # best-effort cleanup
@@ -280,19 +437,28 @@ def schedule_or_send_now(
         pass
 
     if post.send_at <= now:
-        asyncio.create_task(_send_post(bot, session_factory, post.id, tz))
+        _send_in_background(bot, session_factory, post.id, tz)
         return
 
     scheduler.add_job(
-        _send_post,
+        _run_scheduled_post,
         trigger=DateTrigger(run_date=post.send_at),
         id=jobid,
-        args=[bot, session_factory, post.id, tz],
+        args=[post.id],
         replace_existing=True,
         misfire_grace_time=60 * 60,
     )
 
 
+# Jobs carry only the post id; the bot/session factory/tz are set here by setup_scheduler().
+_runtime: dict = {}
+
+
+async def _run_scheduled_post(post_id: int) -> None:
+    _track(asyncio.current_task())
+    await _send_post_guarded(_runtime["bot"], _runtime["session_factory"], post_id, _runtime["tz"])
+
+
 def unschedule_post(scheduler: AsyncIOScheduler, post_id: int) -> None:
     try:
         scheduler.remove_job(_job_id(post_id))
@@ -300,24 +466,24 @@ def unschedule_post(scheduler: AsyncIOScheduler, post_id: int) -> None:
         pass
 
 
-def setup_scheduler(*, bot: Bot, session_factory, tz: str) -> AsyncIOScheduler:
+async def setup_scheduler(*, bot: Bot, session_factory, tz: str) -> AsyncIOScheduler:
+    _runtime.update(bot=bot, session_factory=session_factory, tz=tz)
+    # In-memory job store: the posts table is the source of truth, so jobs are rebuilt from
+    # unsent posts on every start and no blocking job-store I/O ever runs on the event loop.
     scheduler = AsyncIOScheduler()
     scheduler.start()
 
-    db: Session = session_factory()
-    try:
+    async with session_factory() as db:
         now = dt.datetime.now()
 
-        due = get_unsent_due_posts(db, now=now)
-        for post in due:
-            asyncio.create_task(_send_post(bot, session_factory, post.id, tz))
+        due = await get_unsent_due_posts(db, now=now)
+        if due:
+            _track(asyncio.create_task(_send_due_posts(bot, session_factory, [post.id for post in due], tz)))
 
-        future = get_unsent_future_posts(db, now=now)
+        future = await get_unsent_future_posts(db, now=now)
         for post in future:
-            schedule_or_send_now(bot=bot, scheduler=scheduler, session_factory=session_factory, post=post, tz=tz)
-    finally:
-        db.close()
+            schedule_or_send_now(
+                bot=bot, scheduler=scheduler, session_factory=session_factory, post=post, tz=tz, now=now
+            )
 
     return scheduler
-
-
@@ -1,15 +1,20 @@
-import json
+import asyncio
+import datetime as dt
 import os
 from pathlib import Path
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+import msgspec
+from sqlalchemy import select, tuple_
 
-from bot.db import Post, create_post
+from bot.db import Post
 from bot.time_utils import parse_moscow_datetime
 
 
-def seed_posts_from_json(*, session_factory, json_path: str, tz: str) -> int:
+def _load_seed(path: Path) -> dict:
+    return msgspec.json.decode(path.read_bytes())
+
+
+async def seed_posts_from_json(*, session_factory, json_path: str, tz: str) -> int:
     """
     Loads posts from JSON and inserts them into DB if missing (idempotent by key/level/send_at).
     Returns number of created posts.
@@ -22,38 +27,46 @@ def seed_posts_from_json(*, session_factory, json_path: str, tz: str) -> int:
     if not path.exists():
         raise FileNotFoundError(f"Seed JSON not found: {path}")
 
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    # parsed off the event loop; msgspec decodes the bytes directly (no intermediate str copy)
+    raw = await asyncio.to_thread(_load_seed, path)
     posts = raw.get("posts", [])
-    created = 0
 
-    db: Session = session_factory()
-    try:
-        for item in posts:
-            key = (item.get("key") or "").strip()
-            title = (item.get("title") or "").strip()
-            level = (item.get("level") or "all").strip()
-            send_at_s = (item.get("send_at") or "").strip()
-            text_html = item.get("text_html") or ""
-            if not key or not title or not send_at_s or not text_html:
-                continue
+    wanted: dict[tuple[str, str, dt.datetime], str] = {}
+    for item in posts:
+        key = (item.get("key") or "").strip()
+        title = (item.get("title") or "").strip()
+        level = (item.get("level") or "all").strip()
+        send_at_s = (item.get("send_at") or "").strip()
+        text_html = item.get("text_html") or ""
+        if not key or not title or not send_at_s or not text_html:
+            continue
 
-            send_at = parse_moscow_datetime(send_at_s, tz)
+        send_at = parse_moscow_datetime(send_at_s, tz)
+        wanted.setdefault((title, level, send_at), text_html)
+    if not wanted:
+        return 0
 
-            # idempotency check
-            exists = db.scalar(
-                select(Post.id).where(
-                    Post.title == title,
-                    Post.level == level,
-                    Post.send_at == send_at,
+    async with session_factory() as db:
+        # idempotency check: one query for all seed keys instead of one per item
+        existing = set(
+            (
+                await db.execute(
+                    select(Post.title, Post.level, Post.send_at).where(
+                        tuple_(Post.title, Post.level, Post.send_at).in_(list(wanted))
+                    )
                 )
-            )
-            if exists:
-                continue
-
-            create_post(db, title=title, text=text_html, send_at=send_at, level=level)
-            created += 1
-    finally:
-        db.close()
+            ).tuples()
+        )
+        new_posts = [
+            Post(title=title, text=text_html, send_at=send_at, level=level, sent=False)
+            for (title, level, send_at), text_html in wanted.items()
+            if (title, level, send_at) not in existing
+        ]
+        if new_posts:
+            # one transaction; the flush batches the INSERTs
+            db.add_all(new_posts)
+            await db.commit()
+        created = len(new_posts)
 
     return created
 
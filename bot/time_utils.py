@@ -1,10 +1,23 @@
 import datetime as dt
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
+# UI/input format for send times
+DT_FORMAT = "%Y-%m-%d %H:%M"
 
+
+@lru_cache(maxsize=None)
+def get_tz(name: str) -> ZoneInfo:
+    # the bot runs in one configured TZ: resolve it once instead of on every message
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=4096)
 def format_dt(d: dt.datetime, tz: str) -> str:
     # We store datetimes as naive (local time), so just format them.
     # `tz` is kept for UI clarity / future extension.
-    return d.strftime("%Y-%m-%d %H:%M")
+    # Cached: list pages and post cards re-render the same send times over and over.
+    return d.strftime(DT_FORMAT)
 
 
 def parse_moscow_datetime(text: str, tz: str) -> dt.datetime:
@@ -12,7 +25,10 @@ def parse_moscow_datetime(text: str, tz: str) -> dt.datetime:
     Parses 'YYYY-MM-DD HH:MM' in provided timezone and returns naive datetime.
     """
     raw = text.strip()
-    value = dt.datetime.strptime(raw, "%Y-%m-%d %H:%M")
+    # fast path for the canonical 'YYYY-MM-DD HH:MM' (seed files, typed input); strptime re-reads the format every call
+    if len(raw) == 16 and raw[4] == "-" and raw[7] == "-" and raw[10] == " " and raw[13] == ":":
+        digits = raw[0:4] + raw[5:7] + raw[8:10] + raw[11:13] + raw[14:16]
+        if digits.isascii() and digits.isdigit():
+            return dt.datetime(int(raw[0:4]), int(raw[5:7]), int(raw[8:10]), int(raw[11:13]), int(raw[14:16]))
+    value = dt.datetime.strptime(raw, DT_FORMAT)
     return value
-
-